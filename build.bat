@@ -29,6 +29,7 @@ set BUILD_TYPE=both
 if "%1"=="onefile" set BUILD_TYPE=onefile
 if "%1"=="onefolder" set BUILD_TYPE=onefolder
 if "%1"=="both" set BUILD_TYPE=both
+if "%1"=="nuitka" set BUILD_TYPE=nuitka
 if "%1"=="help" goto :show_help
 if "%1"=="-h" goto :show_help
 if "%1"=="--help" goto :show_help
@@ -61,18 +62,20 @@ pause
 exit /b 0
 
 :show_help
-echo Usage: build.bat [onefile^|onefolder^|both^|help]
+echo Usage: build.bat [onefile^|onefolder^|both^|nuitka^|help]
 echo.
 echo Options:
 echo   onefile   - Build only one-file executable (slower startup, single file)
 echo   onefolder - Build only one-folder distribution (faster startup, multiple files)
 echo   both      - Build both configurations (default)
+echo   nuitka    - Build a Nuitka-compiled one-file executable (fastest startup)
 echo   help      - Show this help message
 echo.
 echo Examples:
 echo   build.bat              (builds both configurations)
 echo   build.bat onefile      (builds only one-file executable)
 echo   build.bat onefolder    (builds only one-folder distribution)
+echo   build.bat nuitka       (builds only the Nuitka executable)
 echo.
 pause
 exit /b 0
@@ -26,6 +26,7 @@ class CursorToolsBuilder:
         self.build_config = {
             "one_file": True,
             "one_folder": False,
+            "nuitka": False,  # Nuitka AOT-compiled one-file build (opt-in)
             "console": True,
             "admin_manifest": True,
             "optimize": True,
@@ -127,6 +128,15 @@ class CursorToolsBuilder:
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to install PyInstaller: {e}")
 
+    def install_nuitka(self):
+        """Install Nuitka if not available"""
+        try:
+            subprocess.run([sys.executable, "-m", "pip", "install", "nuitka"],
+                         check=True, capture_output=True)
+            print("✅ Nuitka installed successfully")
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to install Nuitka: {e}")
+
     def install_dependencies(self):
         """Install application dependencies"""
         print("\n📦 Installing application dependencies...")
@@ -365,6 +375,59 @@ exe = EXE(
             print(f"❌ One-folder build failed: {e}")
             return None
 
+    def build_nuitka(self):
+        """Build one-file executable compiled with Nuitka"""
+        print("\n⚙️  Building Nuitka one-file executable...")
+        start_time = time.time()
+
+        try:
+            try:
+                import nuitka
+            except ImportError:
+                print("❌ Nuitka not found. Installing...")
+                self.install_nuitka()
+
+            output_dir = self.dist_dir / "nuitka"
+            output_name = f"{self.app_name}.exe"
+
+            # Modules are compiled to C and linked into the executable, so startup skips
+            # the per-import bytecode lookups; the UAC manifest makes Windows elevate at launch
+            cmd = [
+                sys.executable, "-m", "nuitka",
+                "--onefile",
+                "--follow-imports",
+                "--assume-yes-for-downloads",
+                "--python-flag=no_docstrings",
+                f"--output-dir={output_dir}",
+                f"--output-filename={output_name}",
+            ]
+            if self.build_config["admin_manifest"]:
+                cmd.append("--windows-uac-admin")
+            if self.build_config["console"]:
+                cmd.append("--windows-console-mode=force")
+            cmd.append(self.main_script)
+
+            result = subprocess.run(cmd, cwd=self.script_dir, capture_output=True, text=True)
+
+            if result.returncode != 0:
+                raise Exception(f"Nuitka failed:\n{result.stderr}")
+
+            build_time = time.time() - start_time
+            exe_path = output_dir / output_name
+
+            if exe_path.exists():
+                file_size = exe_path.stat().st_size / (1024 * 1024)  # MB
+                print(f"✅ Nuitka build completed in {build_time:.1f}s")
+                print(f"📁 Executable: {exe_path}")
+                print(f"📏 File size: {file_size:.1f} MB")
+                return exe_path
+            else:
+                raise Exception("Executable not found after build")
+
+        except Exception as e:
+            print(f"❌ Nuitka build failed: {e}")
+            return None
+
     def test_executable(self, exe_path):
         """Test the built executable"""
         print(f"\n🧪 Testing executable: {exe_path.name}")
@@ -504,6 +567,11 @@ exe = EXE(
                     exe_path = builds["one-folder"] / f"{self.app_name}.exe"
                     self.test_executable(exe_path)
 
+            if self.build_config["nuitka"]:
+                builds["nuitka"] = self.build_nuitka()
+                if builds["nuitka"]:
+                    self.test_executable(builds["nuitka"])
+
             # Create build information
             self.create_build_info(builds)
 
@@ -526,7 +594,7 @@ def main():
     while i < len(sys.argv):
         arg = sys.argv[i].lower()
 
-        if arg in ["onefile", "onefolder", "both"]:
+        if arg in ["onefile", "onefolder", "both", "nuitka"]:
             build_type = arg
         elif arg == "--version" and i + 1 < len(sys.argv):
             target_version = sys.argv[i + 1]
@@ -534,10 +602,11 @@ def main():
         elif arg.startswith("--version="):
             target_version = arg.split("=", 1)[1]
         else:
-            print("Usage: python build_script.py [onefile|onefolder|both] [--version=X.Y.Z]")
+            print("Usage: python build_script.py [onefile|onefolder|both|nuitka] [--version=X.Y.Z]")
             print("Examples:")
             print("  python build_script.py onefile --version=1.0.0")
             print("  python build_script.py both --version=1.1.0")
+            print("  python build_script.py nuitka --version=1.1.0")
             sys.exit(1)
         i += 1
 
@@ -549,6 +618,10 @@ def main():
         builder.build_config["one_file"] = False
     elif build_type == "both":
         pass  # Build both (default)
+    elif build_type == "nuitka":
+        builder.build_config["one_file"] = False
+        builder.build_config["one_folder"] = False
+        builder.build_config["nuitka"] = True
 
     # Run the build
     builds = builder.build_all()
@@ -5,6 +5,7 @@ Centralized configuration values for Windows-only application
 
 import os
 import configparser
+import functools
 from pathlib import Path
 from typing import Dict, Any
 
@@ -266,8 +267,9 @@ class CursorToolsConfig:
         except Exception as e:
             raise Exception(f"Failed to save configuration: {str(e)}")
 
+    @functools.lru_cache(maxsize=256)
     def get_setting(self, section: str, key: str, fallback: str = None) -> str:
-        """Get a setting value from the config"""
+        """Get a setting value from the config (cached until the next set_setting)"""
         return self.config.get(section, key, fallback=fallback)
 
     def set_setting(self, section: str, key: str, value: str):
@@ -275,6 +277,7 @@ class CursorToolsConfig:
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
+        self.get_setting.cache_clear()
         self.save_config()
 
     def get_cursor_installation_info(self) -> Dict[str, Any]:
@@ -103,10 +103,10 @@ class DeviceIDModifier:
         for i, backup in enumerate(backups, 1):
             backup_table.add_row(
                 str(i),
-                backup["name"][:30] + "..." if len(backup["name"]) > 30 else backup["name"],
+                backup["display_name"],
                 backup["formatted_date"],
                 str(backup["file_count"]),
-                backup["description"][:40] + "..." if len(backup["description"]) > 40 else backup["description"]
+                backup["display_desc"]
             )
 
         backup_panel = Panel(
@@ -122,7 +122,7 @@ class DeviceIDModifier:
         try:
             choice = self.ui_manager.get_user_choice(
                 f"Select backup to restore (1-{len(backups)}) or 'c' to cancel",
-                valid_choices=[str(i) for i in range(1, len(backups) + 1)] + ["c", "C"]
+                valid_choices={str(i) for i in range(1, len(backups) + 1)} | {"c", "C"}
             )
 
             if choice is None or choice.lower() == 'c':
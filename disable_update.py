@@ -5,11 +5,11 @@ Handles disabling Cursor auto-update functionality (Windows-only)
 
 import os
 import shutil
+import stat
 from colorama import Fore, Style
 import subprocess
 from config import config
 import re
-import tempfile
 from ui_manager import UIManager
 
 class UpdateDisabler:
@@ -30,22 +30,23 @@ class UpdateDisabler:
             original_stat = os.stat(self.product_json_path)
             original_mode = original_stat.st_mode
 
-            with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp_file:
-                with open(self.product_json_path, "r", encoding="utf-8") as product_json_file:
-                    content = product_json_file.read()
+            with open(self.product_json_path, "r", encoding="utf-8") as product_json_file:
+                content = product_json_file.read()
 
-                # Use patterns from config
-                for pattern, replacement in self.url_patterns.items():
-                    content = re.sub(pattern, replacement, content)
+            # Use patterns from config
+            for pattern, replacement in self.url_patterns.items():
+                content = re.sub(pattern, replacement, content)
 
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
+            # Write to a fixed sibling file; a stale one left by a crash is simply overwritten
+            tmp_path = self.product_json_path + ".tmp"
+            with open(tmp_path, "wb") as tmp_file:
+                tmp_file.write(content.encode("utf-8"))
 
             # Create backup if enabled
             if config.get_setting('UpdateDisabler', 'create_backup_before_modify', 'true').lower() == 'true':
                 shutil.copy2(self.product_json_path, self.product_json_path + ".old")
 
-            shutil.move(tmp_path, self.product_json_path)
+            os.replace(tmp_path, self.product_json_path)
 
             os.chmod(self.product_json_path, original_mode)
             # Windows doesn't need chown
@@ -54,7 +55,7 @@ class UpdateDisabler:
 
         except Exception as e:
             self.ui_manager.display_error(f"Failed to modify product.json: {e}")
-            if "tmp_path" in locals():
+            if "tmp_path" in locals() and os.path.exists(tmp_path):
                 os.unlink(tmp_path)
             return False
 
@@ -101,30 +102,39 @@ class UpdateDisabler:
             self.ui_manager.display_error(f"Failed to clear update configuration file: {e}")
             return False
 
+    def _write_locked_file(self, path: str, data: bytes, readonly: bool):
+        """Create or truncate a file with a single open/write/close and optionally mark it read-only"""
+        fd = os.open(path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
+            if data:
+                os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        if readonly:
+            # On Windows this sets FILE_ATTRIBUTE_READONLY, same as 'attrib +r'
+            os.chmod(path, stat.S_IREAD)
+
     def _create_blocking_file(self):
         """Create blocking files"""
         try:
+            set_readonly = config.get_setting('UpdateDisabler', 'set_files_readonly', 'true').lower() == 'true'
+
             # Create updater_path blocking file
             try:
                 os.makedirs(os.path.dirname(self.updater_path), exist_ok=True)
-                open(self.updater_path, 'w').close()
-
-                # Set updater_path as read-only (Windows-only)
-                if config.get_setting('UpdateDisabler', 'set_files_readonly', 'true').lower() == 'true':
-                    os.system(f'attrib +r "{self.updater_path}"')
+                self._write_locked_file(self.updater_path, b'', set_readonly)
             except PermissionError:
                 pass  # Skip if locked
 
             # Create update_yml_path blocking file
             if self.update_yml_path and os.path.exists(os.path.dirname(self.update_yml_path)):
                 try:
-                    # Create update_yml_path blocking file
-                    with open(self.update_yml_path, 'w') as f:
-                        f.write('# This file is locked to prevent auto-updates\nversion: 0.0.0\n')
-
-                    # Set update_yml_path as read-only (Windows-only)
-                    if config.get_setting('UpdateDisabler', 'set_files_readonly', 'true').lower() == 'true':
-                        os.system(f'attrib +r "{self.update_yml_path}"')
+                    self._write_locked_file(
+                        self.update_yml_path,
+                        b'# This file is locked to prevent auto-updates\nversion: 0.0.0\n',
+                        set_readonly
+                    )
                 except PermissionError:
                     pass  # Skip if locked
 
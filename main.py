@@ -5,39 +5,79 @@ Main entry point for the command-line application
 
 import sys
 import os
-from colorama import init
+from functools import cached_property
+from colorama import init, just_fix_windows_console
 
-# Initialize colorama for Windows compatibility (centralized initialization)
-init()
+# Initialize colorama for Windows compatibility (centralized initialization). On a console,
+# just_fix_windows_console() switches on native ANSI processing and only wraps stdout where
+# that isn't available, so writes skip colorama's per-call translation. Redirected output
+# still goes through init(), which strips the color codes instead of writing them to the file
+if sys.stdout is not None and sys.stdout.isatty():
+    just_fix_windows_console()
+else:
+    init()
 
 from ui_manager import UIManager
-from device_id_modifier import DeviceIDModifier
-from account_info_manager import AccountInfoManager
-from disable_update_manager import DisableUpdateManager
-from reset_machine_id_manager import ResetMachineIDManager
-from pro_features_manager import ProUIFeaturesMenuManager
-from auto_update_manager import AutoUpdateManager
-from language_manager import LanguageSettingsManager
 from utils import is_admin, run_as_admin
 
+# Main menu choices, in display order; the last one exits
+MAIN_MENU_CHOICES = ("1", "2", "3", "4", "5", "6", "7")
+EXIT_CHOICE = MAIN_MENU_CHOICES[-1]
+
 class CursorToolsApp:
     def __init__(self):
         self.ui_manager = UIManager()
-        self.device_modifier = DeviceIDModifier()
-        self.account_info_manager = AccountInfoManager()
-        self.disable_update_manager = DisableUpdateManager()
-        self.reset_machine_id_manager = ResetMachineIDManager()
-        self.pro_features_manager = ProUIFeaturesMenuManager()
-        self.auto_update_manager = AutoUpdateManager()
-        self.language_settings_manager = LanguageSettingsManager()
+
+        # Main menu jump table; lambdas defer the lazy manager lookups until selected
+        self._menu_handlers = {
+            "1": lambda: self.account_info_manager.run_account_info_menu(),
+            "2": lambda: self.device_modifier.run_device_id_menu(),
+            "3": lambda: self.disable_update_manager.run_disable_update_menu(),
+            "4": lambda: self.reset_machine_id_manager.run_reset_machine_id_menu(),
+            "5": lambda: self.pro_features_manager.run_pro_ui_features_menu(),
+            "6": lambda: self.language_settings_manager.run_language_settings_menu(),
+            EXIT_CHOICE: self.exit_application,
+        }
+
+    # Feature managers are imported and created the first time their menu is used
+
+    @cached_property
+    def device_modifier(self):
+        from device_id_modifier import DeviceIDModifier
+        return DeviceIDModifier()
+
+    @cached_property
+    def account_info_manager(self):
+        from account_info_manager import AccountInfoManager
+        return AccountInfoManager()
+
+    @cached_property
+    def disable_update_manager(self):
+        from disable_update_manager import DisableUpdateManager
+        return DisableUpdateManager()
+
+    @cached_property
+    def reset_machine_id_manager(self):
+        from reset_machine_id_manager import ResetMachineIDManager
+        return ResetMachineIDManager()
+
+    @cached_property
+    def pro_features_manager(self):
+        from pro_features_manager import ProUIFeaturesMenuManager
+        return ProUIFeaturesMenuManager()
+
+    @cached_property
+    def auto_update_manager(self):
+        from auto_update_manager import AutoUpdateManager
+        return AutoUpdateManager()
+
+    @cached_property
+    def language_settings_manager(self):
+        from language_manager import LanguageSettingsManager
+        return LanguageSettingsManager()
 
     def run(self):
         """Main application loop"""
-        # Check if running on Windows
-        if os.name != 'nt':
-            print("This application is designed for Windows only.")
-            sys.exit(1)
-
         # Check for administrator privileges and request if needed
         if not is_admin():
             print("Requesting administrator privileges...")
@@ -58,31 +98,18 @@ class CursorToolsApp:
 
         try:
             while True:
-                self.ui_manager.clear_screen()
-                self.ui_manager.display_header()
-                self.ui_manager.display_main_menu()
+                self.ui_manager.render_main_screen()
 
                 choice = self.ui_manager.get_user_choice(
-                    valid_choices=["1", "2", "3", "4", "5", "6", "7"]
+                    valid_choices=MAIN_MENU_CHOICES
                 )
 
                 if choice is None:  # User pressed Ctrl+C
                     self.exit_application()
                     break
-                elif choice == "1":
-                    self.account_info_manager.run_account_info_menu()
-                elif choice == "2":
-                    self.device_modifier.run_device_id_menu()
-                elif choice == "3":
-                    self.disable_update_manager.run_disable_update_menu()
-                elif choice == "4":
-                    self.reset_machine_id_manager.run_reset_machine_id_menu()
-                elif choice == "5":
-                    self.pro_features_manager.run_pro_ui_features_menu()
-                elif choice == "6":
-                    self.language_settings_manager.run_language_settings_menu()
-                elif choice == "7":
-                    self.exit_application()
+
+                self._menu_handlers[choice]()
+                if choice == EXIT_CHOICE:
                     break
 
         except KeyboardInterrupt:
@@ -105,6 +132,11 @@ class CursorToolsApp:
 
 def main():
     """Application entry point"""
+    # Check if running on Windows before building the app
+    if os.name != 'nt':
+        print("This application is designed for Windows only.")
+        sys.exit(1)
+
     try:
         app = CursorToolsApp()
         app.run()
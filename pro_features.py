@@ -4,23 +4,62 @@ Handles Pro-related UI modifications, database updates, and feature unlocking
 """
 
 import os
-import json
+import mmap
+import re
+import hashlib
 import shutil
 import sqlite3
-import tempfile
-import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 from colorama import Fore, Style
 from datetime import datetime, timedelta
 from config import config
-from utils import get_workbench_cursor_path, FileManager, BackupManager
+from utils import get_workbench_cursor_path, FileManager, BackupManager, LiteralReplacer, format_backup_timestamp
 from ui_manager import UIManager
 from language_manager import language_manager
 
-# Removed find_ui_files() - now using utils.FileManager.find_files_by_pattern()
+# Removed find_ui_files() - now using utils.FileManager.find_files_by_extensions()
 
+# Path table resolved once at config load; bound here so call sites skip the config attribute lookup
+_PATHS = config.reset_machine_id_paths
 
+# Replacement tables built once and applied in table order, as each key's output can feed a later key.
+# The patterns are plain ASCII, so files are patched as raw bytes with no decode/encode round trip
+_WB_TABLE = {key.encode("utf-8"): value.encode("utf-8") for key, value in config.reset_machine_id_patterns.items()}
+_WB_REPLACER = LiteralReplacer(_WB_TABLE)
+_UI_TABLE = {key.encode("utf-8"): value.encode("utf-8") for key, value in config.ui_modification_patterns.items()}
+_UI_REPLACER = LiteralReplacer(_UI_TABLE)
 
-def modify_workbench_js(file_path: str, silent=False, ui_manager=None) -> bool:
+# Encoded keys for the memory-mapped "anything to do?" check that runs before a file is copied out.
+# A few mmap.find calls beat one alternation regex here (find is a two-way/memchr search, the
+# regex steps through every byte), so instead the keys are cut down to those not containing another
+_WB_NEEDLES = FileManager.covering_needles(_WB_TABLE)
+_UI_NEEDLES = FileManager.covering_needles(_UI_TABLE)
+
+# UI files recorded as needing no patch are skipped on later runs while their size and mtime
+# are unchanged. A stat is free next to reading (or hashing) a bundle; the recorded set is
+# tied to the pattern table, so new patterns rescan everything
+_UI_FINGERPRINTS_FILE = "patched_fingerprints.json"
+_UI_TABLE_DIGEST = hashlib.blake2b(repr(sorted(_UI_TABLE.items())).encode("utf-8"), digest_size=16).hexdigest()
+
+# The workbench is recorded as this tool last left it: its table is not idempotent
+# ("notifications-toasts" grows a "hidden" on every pass), so a repeat run that finds the
+# file unchanged since then skips it instead of reading, rewriting and re-appending
+_WB_FINGERPRINTS_FILE = "workbench_fingerprint.json"
+_WB_TABLE_DIGEST = hashlib.blake2b(repr(sorted(_WB_TABLE.items())).encode("utf-8"), digest_size=16).hexdigest()
+
+# Backup timestamps ("%Y%m%d_%H%M%S") sort lexicographically, so they are compared as strings
+_TIMESTAMP_RE = re.compile(r"\d{8}_\d{6}")
+
+# UI files are independent and the work is I/O-bound, so they are handled on a thread pool
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Backup copies run here while the caller prepares its new content. Callers wait on the copy
+# before touching the original, so a backup never captures a half-modified file
+_BACKUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pro-backup")
+
+
+def modify_workbench_js(file_path: str, silent=False, ui_manager=None, timestamp=None, skip_per_file_backup=False) -> bool:
     """Modify workbench file content with Pro patterns"""
     if ui_manager is None:
         ui_manager = UIManager()
@@ -30,49 +69,183 @@ def modify_workbench_js(file_path: str, silent=False, ui_manager=None) -> bool:
         original_stat = os.stat(file_path)
         original_mode = original_stat.st_mode
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", errors="ignore", delete=False) as tmp_file:
-            # Read original content
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as main_file:
-                content = main_file.read()
+        # Unchanged since this tool last patched (or checked) it
+        fingerprint = [original_stat.st_size, original_stat.st_mtime_ns]
+        if _load_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST).get(file_path) == fingerprint:
+            return True
 
-            patterns = config.reset_machine_id_patterns
+        # Empty files can't be mapped and have nothing to patch
+        if original_stat.st_size == 0:
+            return True
 
-            # Use patterns from config for replacements
-            for old_pattern, new_pattern in patterns.items():
-                content = content.replace(old_pattern, new_pattern)
+        with open(file_path, "rb") as source:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Nothing to patch (e.g. already modified) leaves the file and backups alone
+                if not any(mm.find(needle) != -1 for needle in _WB_NEEDLES):
+                    _save_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST, {file_path: fingerprint})
+                    return True
+
+                # Backup original file with timestamp to centralized backup directory (in the background),
+                # unless a full backup taken just before already holds a copy
+                backup_future = None
+                if not skip_per_file_backup:
+                    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+                    backup_filename = f"workbench.desktop.main.js.pro.backup.{timestamp}"
+                    backup_path = os.path.join(_PATHS['reset_backups_dir'], backup_filename)
+                    backup_future = _BACKUP_EXECUTOR.submit(FileManager.fast_copy, file_path, backup_path)
+
+                # Use patterns from config for replacements
+                content, changed = _WB_REPLACER.subn(mm[:])
+
+        if backup_future is not None:
+            backup_future.result()
+
+        # No key changed anything - drop the backup
+        if not changed:
+            if backup_future is not None:
+                os.unlink(backup_path)
+            _save_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST, {file_path: fingerprint})
+            return True
 
-            # Write to temporary file
+        # Write next to the original (same volume) so it can be swapped in with a single rename
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "wb") as tmp_file:
             tmp_file.write(content)
-            tmp_path = tmp_file.name
 
-        # Backup original file with timestamp to centralized backup directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"workbench.desktop.main.js.pro.backup.{timestamp}"
-        backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-        shutil.copy2(file_path, backup_path)
-
-        # Move temporary file to original position
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        shutil.move(tmp_path, file_path)
+        # Swap the temporary file into place now that the backup is complete
+        os.replace(tmp_path, file_path)
 
         # Restore original permissions (Windows-only)
         os.chmod(file_path, original_mode)
 
+        patched_stat = os.stat(file_path)
+        _save_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST,
+                           {file_path: [patched_stat.st_size, patched_stat.st_mtime_ns]})
+
         return True
 
     except Exception as e:
         if not silent:
             ui_manager.display_text('pro.modify_file_failed', "error", error=str(e))
-        if "tmp_path" in locals():
+        if "tmp_path" in locals() and os.path.exists(tmp_path):
             try:
                 os.unlink(tmp_path)
-            except:
+            except OSError:
                 pass
         return False
 
-def modify_ui_files(silent=False, ui_manager=None) -> bool:
+def _load_fingerprints(file_name: str, patterns_digest: str) -> dict:
+    """Return the recorded [size, mtime_ns] per file, if recorded under the current patterns"""
+    try:
+        data = FileManager.read_json(os.path.join(_PATHS['pro_backups_dir'], file_name))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("patterns") != patterns_digest:
+        return {}
+    return data.get("files", {})
+
+def _stat_fingerprint(file_path: str) -> Optional[list]:
+    """Return [size, mtime_ns] of a file, or None if it can't be stat'ed"""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [file_stat.st_size, file_stat.st_mtime_ns]
+
+def _save_fingerprints(file_name: str, patterns_digest: str, files: dict) -> None:
+    """Record [size, mtime_ns] per file; failing to write it only costs a rescan"""
+    try:
+        os.makedirs(_PATHS['pro_backups_dir'], exist_ok=True)
+        FileManager.write_json(os.path.join(_PATHS['pro_backups_dir'], file_name),
+                    {"patterns": patterns_digest, "files": files})
+    except OSError:
+        pass
+
+def _process_ui_file(file_path: str, backup_dir: Optional[str], timestamp: str, known=None) -> tuple:
+    """Back up (unless backup_dir is None) and patch a UI file; returns (modified, [size, mtime_ns] if now clean)"""
+    file_stat = os.stat(file_path)
+    fingerprint = [file_stat.st_size, file_stat.st_mtime_ns]
+
+    # Unchanged since a run that left it fully patched
+    if fingerprint == known:
+        return False, fingerprint
+
+    # Only files containing Pro Trial or other target patterns are read
+    content = FileManager.read_if_contains_any(file_path, _UI_NEEDLES)
+    if content is None:
+        return False, fingerprint
+
+    # Apply UI patterns, counting the keys that actually change something
+    new_content, changed = _UI_REPLACER.subn(content)
+
+    # No key changed anything - nothing to write or back up
+    if not changed:
+        return False, fingerprint
+
+    # Create backup
+    if backup_dir is not None:
+        backup_filename = f"{os.path.basename(file_path)}.pro.ui.backup.{timestamp}"
+        backup_path = os.path.join(backup_dir, backup_filename)
+        FileManager.fast_copy(file_path, backup_path)
+
+    # Write modified content
+    with open(file_path, "wb") as f:
+        f.write(new_content)
+
+    # Only record files the patterns can't change again; otherwise the next run rechecks them
+    if not _UI_REPLACER.idempotent:
+        return True, None
+    file_stat = os.stat(file_path)
+    return True, [file_stat.st_size, file_stat.st_mtime_ns]
+
+def _backup_ui_file(file_path: str, ui_path: str, ui_backup_dir: str, previous_files: dict) -> dict:
+    """Copy a UI file into a full backup, returning its manifest entry"""
+    # Create relative path structure
+    rel_path = os.path.relpath(file_path, ui_path)
+    backup_file_path = os.path.join(ui_backup_dir, rel_path)
+
+    # Create directory structure
+    os.makedirs(os.path.dirname(backup_file_path), exist_ok=True)
+
+    with open(file_path, "rb") as f:
+        file_hash = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    # Unchanged since the previous backup - hardlink its copy (backups are never modified)
+    previous = previous_files.get(file_path)
+    linked = False
+    if previous and previous[0] == file_hash:
+        try:
+            os.link(previous[1], backup_file_path)
+            linked = True
+        except OSError:
+            pass
+
+    # Copy file
+    if not linked:
+        FileManager.fast_copy(file_path, backup_file_path)
+
+    return {
+        "type": "ui_file",
+        "original": file_path,
+        "backup": os.path.join("ui_files", os.path.basename(ui_path), rel_path),
+        "hash": file_hash
+    }
+
+def _restore_file(backup_path: str, file_info: dict) -> bool:
+    """Copy one file from a full backup back into place, returning False if its copy is missing"""
+    backup_file = os.path.join(backup_path, file_info["backup"])
+
+    # Restore file; its directory was created before the copies started
+    try:
+        FileManager.fast_copy(backup_file, file_info["original"])
+    except FileNotFoundError:
+        # Anything else not found (e.g. a target directory that couldn't be created) is a failed copy
+        if os.path.exists(backup_file):
+            raise
+        return False
+    return True
+
+def modify_ui_files(silent=False, ui_manager=None, timestamp=None, skip_per_file_backup=False) -> bool:
     """Comprehensive UI modification based on reset.js mc function"""
     if ui_manager is None:
         ui_manager = UIManager()
@@ -82,14 +255,28 @@ def modify_ui_files(silent=False, ui_manager=None) -> bool:
             ui_manager.display_text('pro.ui_customization', "step")
 
         # Get UI paths from config
-        reset_paths = config.reset_machine_id_paths
         ui_paths = [
-            reset_paths['ui_out_path'],
-            reset_paths['ui_dist_path']
+            _PATHS['ui_out_path'],
+            _PATHS['ui_dist_path']
         ]
 
         modified_files = 0
-        ui_patterns = config.ui_modification_patterns
+
+        # One backup timestamp for the whole run, so its backups group together. With
+        # skip_per_file_backup the caller's full backup already holds every file
+        backup_dir = None if skip_per_file_backup else _PATHS['reset_backups_dir']
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        known_fingerprints = _load_fingerprints(_UI_FINGERPRINTS_FILE, _UI_TABLE_DIGEST)
+        fingerprints = {}
+
+        # The workbench sits under out/, so this pass may rewrite it. If it is still as the
+        # workbench step left it, it is re-recorded afterwards so the next apply skips it
+        workbench_fingerprints = {
+            path: recorded
+            for path, recorded in _load_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST).items()
+            if _stat_fingerprint(path) == recorded
+        }
 
         for base_path in ui_paths:
             if not os.path.exists(base_path):
@@ -98,42 +285,36 @@ def modify_ui_files(silent=False, ui_manager=None) -> bool:
             if not silent:
                 ui_manager.display_text('pro.searching_in', "step", path=base_path)
 
-            # Find JS and HTML files
-            js_files = FileManager.find_files_by_pattern(base_path, patterns=[], extensions=['.js'])
-            html_files = FileManager.find_files_by_pattern(base_path, patterns=[], extensions=['.html'])
-            all_files = js_files + html_files
-
-            for file_path in all_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-
-                    # Check if file contains Pro Trial or other target patterns
-                    should_modify = any(pattern in content for pattern in ui_patterns.keys())
-
-                    if should_modify:
-                        # Create backup
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        backup_filename = f"{os.path.basename(file_path)}.pro.ui.backup.{timestamp}"
-                        backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-                        shutil.copy2(file_path, backup_path)
-
-                        # Apply UI patterns
-                        new_content = content
-                        for old_pattern, new_pattern in ui_patterns.items():
-                            new_content = new_content.replace(old_pattern, new_pattern)
-
-                        # Write modified content
-                        with open(file_path, "w", encoding="utf-8", errors="ignore") as f:
-                            f.write(new_content)
+            # Find JS and HTML files and process them concurrently; output stays on this thread
+            with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+                futures = {
+                    executor.submit(_process_ui_file, file_path, backup_dir, timestamp,
+                                    known_fingerprints.get(file_path)): file_path
+                    for file_path in FileManager.find_files_by_extensions(base_path, ('.js', '.html'))
+                }
+
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        modified, fingerprint = future.result()
+                        if fingerprint is not None:
+                            fingerprints[file_path] = fingerprint
+                        if modified:
+                            if not silent:
+                                ui_manager.display_text('pro.ui_file_modified', "success", file=file_path)
+                            modified_files += 1
 
+                    except Exception as err:
                         if not silent:
-                            ui_manager.display_text('pro.ui_file_modified', "success", file=file_path)
-                        modified_files += 1
+                            ui_manager.display_text('pro.ui_file_error', "warning", file=file_path, error=str(err))
 
-                except Exception as err:
-                    if not silent:
-                        ui_manager.display_text('pro.ui_file_error', "warning", file=file_path, error=str(err))
+        _save_fingerprints(_UI_FINGERPRINTS_FILE, _UI_TABLE_DIGEST, fingerprints)
+
+        if workbench_fingerprints:
+            workbench_fingerprints = {path: _stat_fingerprint(path) for path in workbench_fingerprints}
+            _save_fingerprints(_WB_FINGERPRINTS_FILE, _WB_TABLE_DIGEST,
+                               {path: fingerprint for path, fingerprint in workbench_fingerprints.items()
+                                if fingerprint is not None})
 
         if not silent:
             if modified_files == 0:
@@ -153,19 +334,27 @@ class ProUIFeaturesBackupManager:
 
     def __init__(self):
         self.ui_manager = UIManager()
-        self.backup_manager = BackupManager(config.reset_machine_id_paths['pro_backups_dir'])
-        self.backup_dir = config.reset_machine_id_paths['pro_backups_dir']
+        self.backup_manager = BackupManager(_PATHS['pro_backups_dir'])
+        self.backup_dir = _PATHS['pro_backups_dir']
         self.sqlite_path = config.cursor_paths['sqlite_path']
-        self.storage_path = config.reset_machine_id_paths['storage_config_path']
-        self.workbench_path = config.reset_machine_id_paths['workbench_path']
+        self.storage_path = _PATHS['storage_config_path']
+        self.workbench_path = _PATHS['workbench_path']
+
+        # Parsed backup manifests keyed by path, stored with the mtime they were read at
+        self._manifest_cache = {}
 
-        # Ensure backup directory exists
-        os.makedirs(self.backup_dir, exist_ok=True)
+        # Whether the last full backup copied every file it found
+        self.last_backup_complete = False
 
-    def create_full_backup(self, silent=False) -> str:
+        # Ensure backup directory exists (one stat when it already does)
+        if not os.path.isdir(self.backup_dir):
+            os.makedirs(self.backup_dir, exist_ok=True)
+
+    def create_full_backup(self, silent=False, timestamp=None) -> str:
         """Create a complete backup of all Pro Features related files"""
+        self.last_backup_complete = False
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"pro_features_full_backup_{timestamp}"
             backup_path = os.path.join(self.backup_dir, backup_name)
 
@@ -184,74 +373,74 @@ class ProUIFeaturesBackupManager:
                 "description": "Complete Pro Features backup including UI files, database, and storage config"
             }
 
-            # Backup SQLite database
-            if os.path.exists(self.sqlite_path):
+            # Backup SQLite database (files that don't exist are simply skipped)
+            try:
                 sqlite_backup = os.path.join(backup_path, "state.vscdb")
-                shutil.copy2(self.sqlite_path, sqlite_backup)
+                FileManager.fast_copy(self.sqlite_path, sqlite_backup)
                 manifest["files"].append({"type": "database", "original": self.sqlite_path, "backup": "state.vscdb"})
                 if not silent:
                     print(f"{Fore.GREEN}✓ {self.translator.get('pro.backed_up_database') if self.translator else 'Backed up SQLite database'}{Style.RESET_ALL}")
+            except FileNotFoundError:
+                pass
 
             # Backup storage configuration
-            if os.path.exists(self.storage_path):
+            try:
                 storage_backup = os.path.join(backup_path, "storage.json")
-                shutil.copy2(self.storage_path, storage_backup)
+                FileManager.fast_copy(self.storage_path, storage_backup)
                 manifest["files"].append({"type": "storage", "original": self.storage_path, "backup": "storage.json"})
                 if not silent:
                     print(f"{Fore.GREEN}✓ {self.translator.get('pro.backed_up_storage') if self.translator else 'Backed up storage configuration'}{Style.RESET_ALL}")
+            except FileNotFoundError:
+                pass
 
             # Backup workbench file
-            if os.path.exists(self.workbench_path):
+            try:
                 workbench_backup = os.path.join(backup_path, "workbench.desktop.main.js")
-                shutil.copy2(self.workbench_path, workbench_backup)
+                FileManager.fast_copy(self.workbench_path, workbench_backup)
                 manifest["files"].append({"type": "workbench", "original": self.workbench_path, "backup": "workbench.desktop.main.js"})
                 if not silent:
                     print(f"{Fore.GREEN}✓ {self.translator.get('pro.backed_up_workbench') if self.translator else 'Backed up workbench file'}{Style.RESET_ALL}")
+            except FileNotFoundError:
+                pass
 
             # Backup UI files from out and dist directories
             ui_paths = [
-                config.reset_machine_id_paths['ui_out_path'],
-                config.reset_machine_id_paths['ui_dist_path']
+                _PATHS['ui_out_path'],
+                _PATHS['ui_dist_path']
             ]
 
             ui_files_backed_up = 0
+            ui_files_failed = 0
+            previous_files = self._previous_ui_files()
             for ui_path in ui_paths:
                 if os.path.exists(ui_path):
                     ui_backup_dir = os.path.join(backup_path, "ui_files", os.path.basename(ui_path))
                     os.makedirs(ui_backup_dir, exist_ok=True)
 
-                    # Find and backup UI files
-                    js_files = FileManager.find_files_by_pattern(ui_path, patterns=[], extensions=['.js'])
-                    html_files = FileManager.find_files_by_pattern(ui_path, patterns=[], extensions=['.html'])
-
-                    for file_path in js_files + html_files:
-                        try:
-                            # Create relative path structure
-                            rel_path = os.path.relpath(file_path, ui_path)
-                            backup_file_path = os.path.join(ui_backup_dir, rel_path)
-
-                            # Create directory structure
-                            os.makedirs(os.path.dirname(backup_file_path), exist_ok=True)
-
-                            # Copy file
-                            shutil.copy2(file_path, backup_file_path)
-                            manifest["files"].append({
-                                "type": "ui_file",
-                                "original": file_path,
-                                "backup": os.path.join("ui_files", os.path.basename(ui_path), rel_path)
-                            })
-                            ui_files_backed_up += 1
-                        except Exception as e:
-                            if not silent:
-                                print(f"{Fore.YELLOW}⚠ {self.translator.get('pro.backup_file_warning', file=file_path, error=str(e)) if self.translator else f'Warning backing up {file_path}: {e}'}{Style.RESET_ALL}")
+                    # Find and backup UI files concurrently; the manifest is only touched on this thread
+                    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+                        futures = {
+                            executor.submit(_backup_ui_file, file_path, ui_path, ui_backup_dir, previous_files): file_path
+                            for file_path in FileManager.find_files_by_extensions(ui_path, ('.js', '.html'))
+                        }
+
+                        for future in as_completed(futures):
+                            file_path = futures[future]
+                            try:
+                                manifest["files"].append(future.result())
+                                ui_files_backed_up += 1
+                            except Exception as e:
+                                ui_files_failed += 1
+                                if not silent:
+                                    print(f"{Fore.YELLOW}⚠ {self.translator.get('pro.backup_file_warning', file=file_path, error=str(e)) if self.translator else f'Warning backing up {file_path}: {e}'}{Style.RESET_ALL}")
 
             if ui_files_backed_up > 0 and not silent:
                 print(f"{Fore.GREEN}✓ {self.translator.get('pro.backed_up_ui_files', count=ui_files_backed_up) if self.translator else f'Backed up {ui_files_backed_up} UI files'}{Style.RESET_ALL}")
 
             # Save manifest
             manifest_path = os.path.join(backup_path, "backup_manifest.json")
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                json.dump(manifest, f, indent=2)
+            FileManager.write_json(manifest_path, manifest)
+            self.last_backup_complete = ui_files_failed == 0
 
             if not silent:
                 print(f"{Fore.GREEN}✓ {self.translator.get('pro.backup_created', name=backup_name) if self.translator else f'Full backup created: {backup_name}'}{Style.RESET_ALL}")
@@ -262,45 +451,88 @@ class ProUIFeaturesBackupManager:
                 self.ui_manager.display_localized_error('pro.backup_failed', self.translator, error=str(e))
             return None
 
+    def _previous_ui_files(self) -> dict:
+        """Map UI files to their hash and backup copy in the newest backup that recorded hashes"""
+        for backup in self.list_backups():
+            manifest = backup["manifest"]
+            if not manifest:
+                continue
+
+            previous_files = {
+                file_info["original"]: (file_info["hash"], os.path.join(backup["path"], file_info["backup"]))
+                for file_info in manifest.get("files", [])
+                if file_info.get("type") == "ui_file" and "hash" in file_info
+            }
+            if previous_files:
+                return previous_files
+
+        return {}
+
     def list_backups(self) -> list:
         """List all available Pro Features backups"""
         try:
             backups = []
-            backup_dirs = glob.glob(os.path.join(self.backup_dir, "pro_features_*_backup_*"))
 
-            for backup_dir in backup_dirs:
-                if os.path.isdir(backup_dir):
+            # One directory pass; DirEntry already knows which entries are directories
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    # Same names as the old "pro_features_*_backup_*" glob
+                    name = entry.name
+                    if not (name.startswith("pro_features_") and "_backup_" in name[len("pro_features_"):]
+                            and entry.is_dir(follow_symlinks=False)):
+                        continue
+
+                    backup_dir = entry.path
                     manifest_path = os.path.join(backup_dir, "backup_manifest.json")
-                    if os.path.exists(manifest_path):
-                        try:
-                            with open(manifest_path, "r", encoding="utf-8") as f:
-                                manifest = json.load(f)
-
-                            backup_info = {
-                                "name": manifest.get("backup_name", os.path.basename(backup_dir)),
-                                "timestamp": manifest.get("timestamp", "unknown"),
-                                "type": manifest.get("backup_type", "unknown"),
-                                "description": manifest.get("description", "No description"),
-                                "file_count": len(manifest.get("files", [])),
-                                "path": backup_dir,
-                                "manifest": manifest
-                            }
-                            backups.append(backup_info)
-                        except Exception as e:
-                            # If manifest is corrupted, create basic info
-                            backup_info = {
-                                "name": os.path.basename(backup_dir),
-                                "timestamp": "unknown",
-                                "type": "unknown",
-                                "description": "Corrupted backup manifest",
-                                "file_count": 0,
-                                "path": backup_dir,
-                                "manifest": None
-                            }
-                            backups.append(backup_info)
+                    try:
+                        # The stat both checks the manifest exists and dates it
+                        mtime_ns = os.stat(manifest_path).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+
+                    try:
+                        # Only re-parse manifests that changed since the last listing
+                        cached = self._manifest_cache.get(manifest_path)
+                        if cached and cached[0] == mtime_ns:
+                            manifest = cached[1]
+                        else:
+                            manifest = FileManager.read_json(manifest_path)
+                            self._manifest_cache[manifest_path] = (mtime_ns, manifest)
+
+                        backup_info = {
+                            "name": manifest.get("backup_name", name),
+                            "timestamp": manifest.get("timestamp", "unknown"),
+                            "type": manifest.get("backup_type", "unknown"),
+                            "description": manifest.get("description", "No description"),
+                            "file_count": len(manifest.get("files", [])),
+                            "path": backup_dir,
+                            "manifest": manifest
+                        }
+                        sort_key = backup_info["timestamp"]
+                    except Exception as e:
+                        # If manifest is corrupted, create basic info
+                        backup_info = {
+                            "name": name,
+                            "timestamp": "unknown",
+                            "type": "unknown",
+                            "description": "Corrupted backup manifest",
+                            "file_count": 0,
+                            "path": backup_dir,
+                            "manifest": None
+                        }
+                        # Place it by when the manifest was last written instead
+                        sort_key = datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y%m%d_%H%M%S")
+
+                    # Display fields for the restore table, built once per listing instead of per row drawn
+                    backup_name, description = backup_info["name"], backup_info["description"]
+                    backup_info["formatted_date"] = format_backup_timestamp(backup_info["timestamp"])
+                    backup_info["display_name"] = backup_name if len(backup_name) <= 30 else backup_name[:30] + "..."
+                    backup_info["display_desc"] = description if len(description) <= 40 else description[:40] + "..."
+                    backups.append((sort_key, backup_info))
 
             # Sort by timestamp (newest first)
-            backups.sort(key=lambda x: x["timestamp"], reverse=True)
+            backups.sort(key=lambda item: item[0], reverse=True)
+            backups = [backup_info for _, backup_info in backups]
             return backups
 
         except Exception as e:
@@ -318,40 +550,53 @@ class ProUIFeaturesBackupManager:
                 return False
 
             # Load manifest
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                manifest = json.load(f)
+            manifest = FileManager.read_json(manifest_path)
 
             self.ui_manager.display_text('pro.restoring_backup', "step", name=backup_name)
 
             restored_files = 0
             failed_files = 0
+            files = manifest.get("files", [])
+
+            # The workbench is listed both on its own and among the out/ UI files; copying both
+            # at once would race on the same target, so each target is restored once (last entry
+            # wins, as when the entries were restored in order)
+            files = list({os.path.normcase(os.path.normpath(file_info["original"])): file_info
+                          for file_info in files}.values())
 
-            # Restore each file
-            for file_info in manifest.get("files", []):
+            # Create each target directory once, up front, rather than once per file
+            for directory in {os.path.dirname(file_info["original"]) for file_info in files}:
                 try:
-                    backup_file = os.path.join(backup_path, file_info["backup"])
-                    original_file = file_info["original"]
-
-                    if os.path.exists(backup_file):
-                        # Create directory if needed
-                        os.makedirs(os.path.dirname(original_file), exist_ok=True)
-
-                        # Restore file
-                        shutil.copy2(backup_file, original_file)
-                        restored_files += 1
-
-                        file_type = file_info.get("type", "unknown")
-                        self.ui_manager.display_text('pro.restored_file', "success", type=file_type, file=os.path.basename(original_file))
-                    else:
-                        backup_file_name = file_info['backup']
-                        self.ui_manager.display_text('pro.backup_file_missing', "warning", file=backup_file_name)
+                    os.makedirs(directory, exist_ok=True)
+                except OSError:
+                    # The copies into it fail and are reported individually
+                    pass
+
+            # Restore the files concurrently; results are reported from this thread
+            with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+                futures = {
+                    executor.submit(_restore_file, backup_path, file_info): file_info
+                    for file_info in files
+                }
+
+                for future in as_completed(futures):
+                    file_info = futures[future]
+                    try:
+                        if future.result():
+                            restored_files += 1
+
+                            file_type = file_info.get("type", "unknown")
+                            self.ui_manager.display_text('pro.restored_file', "success", type=file_type, file=os.path.basename(file_info["original"]))
+                        else:
+                            backup_file_name = file_info['backup']
+                            self.ui_manager.display_text('pro.backup_file_missing', "warning", file=backup_file_name)
+                            failed_files += 1
+
+                    except Exception as e:
+                        backup_file_name = file_info.get('backup', 'unknown')
+                        self.ui_manager.display_text('pro.restore_file_failed', "error", file=backup_file_name, error=str(e))
                         failed_files += 1
 
-                except Exception as e:
-                    backup_file_name = file_info.get('backup', 'unknown')
-                    self.ui_manager.display_text('pro.restore_file_failed', "error", file=backup_file_name, error=str(e))
-                    failed_files += 1
-
             if failed_files == 0:
                 self.ui_manager.display_text('pro.restore_success', "success", count=restored_files)
                 return True
@@ -373,6 +618,7 @@ class ProUIFeaturesBackupManager:
                 return False
 
             shutil.rmtree(backup_path)
+            self._manifest_cache.pop(os.path.join(backup_path, "backup_manifest.json"), None)
             self.ui_manager.display_text('pro.backup_deleted', "success", name=backup_name)
             return True
 
@@ -383,22 +629,22 @@ class ProUIFeaturesBackupManager:
     def cleanup_old_backups(self, retention_days: int = 30) -> int:
         """Clean up old backups based on retention policy"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
+            cutoff = (datetime.now() - timedelta(days=retention_days)).strftime("%Y%m%d_%H%M%S")
             backups = self.list_backups()
             deleted_count = 0
 
             for backup in backups:
                 try:
-                    # Parse timestamp
-                    backup_date = datetime.strptime(backup["timestamp"], "%Y%m%d_%H%M%S")
+                    timestamp = backup["timestamp"]
+
+                    # Skip backups with invalid timestamps
+                    if not _TIMESTAMP_RE.fullmatch(timestamp):
+                        continue
 
-                    if backup_date < cutoff_date:
+                    if timestamp < cutoff:
                         if self.delete_backup(backup["name"]):
                             deleted_count += 1
 
-                except ValueError:
-                    # Skip backups with invalid timestamps
-                    continue
                 except Exception as e:
                     backup_name = backup['name']
                     self.ui_manager.display_text('pro.cleanup_warning', "warning", backup=backup_name, error=str(e))
@@ -413,17 +659,34 @@ class ProUIFeaturesBackupManager:
             return 0
 
 class ProUIFeaturesManager:
-    def __init__(self):
+    def __init__(self, translator=None):
         self.ui_manager = UIManager()
 
+        # Optional translator for the verbose step banners; English defaults are used without one
+        self.translator = translator
+        self._tr_cache = {}
+
         # Use centralized configuration (Windows-only)
         self.sqlite_path = config.cursor_paths['sqlite_path']
-        self.storage_path = config.reset_machine_id_paths['storage_config_path']
+        self.storage_path = _PATHS['storage_config_path']
 
         # Initialize backup manager
         self.backup_manager = ProUIFeaturesBackupManager()
 
-    def update_pro_tier_database(self, silent=False) -> bool:
+    def _t(self, key: str, default: str, **kwargs) -> str:
+        """Translated banner text (or the default without a translator); parameterless texts are memoized"""
+        # Texts with runtime parameters (errors, backup names) are one-offs; caching them would
+        # only grow the memo, which stays bounded by the number of fixed banner keys
+        if kwargs:
+            return self.translator.get(key, **kwargs) if self.translator else default
+
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.translator.get(key) if self.translator else default
+            self._tr_cache[key] = text
+        return text
+
+    def update_pro_tier_database(self, silent=False, timestamp=None) -> bool:
         """Update SQLite database with Pro tier and usage reset"""
         try:
             if not silent:
@@ -435,35 +698,39 @@ class ProUIFeaturesManager:
                 return False
 
             # Create backup
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_filename = f"state.vscdb.pro.backup.{timestamp}"
-            backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-            shutil.copy2(self.sqlite_path, backup_path)
+            backup_path = os.path.join(_PATHS['reset_backups_dir'], backup_filename)
+            FileManager.fast_copy(self.sqlite_path, backup_path)
 
             conn = sqlite3.connect(self.sqlite_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ItemTable (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
-
-            # Reset usage data (from reset.js bt function)
-            cursor.execute("""
-                UPDATE ItemTable SET value = '{"global":{"usage":{"sessionCount":0,"tokenCount":0}}}'
-                WHERE key LIKE '%cursor%usage%'
-            """)
-
-            # Set Pro tier (from reset.js ep function)
-            cursor.execute("""
-                UPDATE ItemTable SET value = '"pro"'
-                WHERE key LIKE '%cursor%tier%'
-            """)
-
-            conn.commit()
-            conn.close()
+            try:
+                # One script in one explicit transaction. synchronous=OFF only lasts for this
+                # connection and skips the commit fsyncs - the file was backed up just above.
+                # IMMEDIATE takes the write lock up front (waiting out a running Cursor through
+                # the busy timeout) instead of failing on a lock upgrade halfway through
+                conn.executescript("""
+                    PRAGMA synchronous=OFF;
+                    PRAGMA temp_store=MEMORY;
+                    BEGIN IMMEDIATE;
+
+                    CREATE TABLE IF NOT EXISTS ItemTable (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    );
+
+                    -- Set Pro tier (from reset.js ep function) and reset usage data (from reset.js bt
+                    -- function) in one table scan; tier comes first, as it used to be applied last
+                    UPDATE ItemTable SET value = CASE
+                        WHEN key LIKE '%cursor%tier%' THEN '"pro"'
+                        ELSE '{"global":{"usage":{"sessionCount":0,"tokenCount":0}}}'
+                    END
+                    WHERE key LIKE '%cursor%tier%' OR key LIKE '%cursor%usage%';
+
+                    COMMIT;
+                """)
+            finally:
+                conn.close()
 
             if not silent:
                 self.ui_manager.display_text('pro.database_updated', "success")
@@ -474,7 +741,7 @@ class ProUIFeaturesManager:
                 self.ui_manager.display_text('pro.database_error', "error", error=str(e))
             return False
 
-    def update_storage_config(self, silent=False) -> bool:
+    def update_storage_config(self, silent=False, timestamp=None) -> bool:
         """Update storage.json configuration with Pro settings"""
         try:
             if not silent:
@@ -485,23 +752,27 @@ class ProUIFeaturesManager:
                     self.ui_manager.display_text('pro.storage_not_found', "warning")
                 return True
 
-            # Create backup
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"storage.json.pro.backup.{timestamp}"
-            backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-            shutil.copy2(self.storage_path, backup_path)
-
             # Read current storage data
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                storage_data = json.load(f)
+            storage_data = FileManager.read_json(self.storage_path)
 
             # Update storage configuration (from reset.js du function)
             if storage_data:
+                # Already applied - nothing to back up or write
+                if storage_data.get('update.mode') == 'none':
+                    if not silent:
+                        self.ui_manager.display_localized_success('pro.storage_updated', self.translator)
+                    return True
+
+                # Create backup
+                timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_filename = f"storage.json.pro.backup.{timestamp}"
+                backup_path = os.path.join(_PATHS['reset_backups_dir'], backup_filename)
+                FileManager.fast_copy(self.storage_path, backup_path)
+
                 storage_data['update.mode'] = 'none'  # Disable auto-updates
 
                 # Write updated storage data
-                with open(self.storage_path, "w", encoding="utf-8") as f:
-                    json.dump(storage_data, f, indent=2)
+                FileManager.write_json(self.storage_path, storage_data)
 
                 if not silent:
                     self.ui_manager.display_localized_success('pro.storage_updated', self.translator)
@@ -521,111 +792,141 @@ class ProUIFeaturesManager:
         try:
             success = True
 
+            # Every backup taken during this run shares one timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
             # Step 0: Create backup before applying changes (if enabled)
             create_backup = config.get_setting('ProFeatures', 'create_backup_before_apply', 'true').lower() == 'true'
             if create_backup:
-                backup_name = self.backup_manager.create_full_backup(silent=True)
+                backup_name = self.backup_manager.create_full_backup(silent=True, timestamp=timestamp)
                 if not backup_name:
                     success = False
 
-            # Step 1: Update Pro tier in database
-            if not self.update_pro_tier_database(silent=True):
-                success = False
+            # A complete full backup already holds the workbench and UI files, so they skip their own copies
+            skip_per_file_backup = create_backup and self.backup_manager.last_backup_complete
 
-            # Step 2: Reset token limits
-            try:
-                from reset_machine_id import reset_token_limits
-                if not reset_token_limits(None):  # Pass None for translator to suppress output
-                    success = False
-            except Exception:
-                success = False
+            # Steps 1-5 touch three disjoint sets of files, so those groups run concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(self._apply_database_steps, timestamp),
+                    executor.submit(self.update_storage_config, True, timestamp),  # Step 3
+                    executor.submit(self._apply_file_steps, timestamp, skip_per_file_backup),
+                ]
 
-            # Step 3: Update storage configuration
-            if not self.update_storage_config(silent=True):
-                success = False
+                for future in as_completed(futures):
+                    if not future.result():
+                        success = False
 
-            # Step 4: Apply workbench modifications
-            try:
-                workbench_path = get_workbench_cursor_path()
-                if not modify_workbench_js(workbench_path, self.translator, silent=True):
-                    success = False
-            except Exception:
-                success = False
+            return success
+
+        except Exception:
+            return False
 
-            # Step 5: Apply comprehensive UI modifications
-            if not modify_ui_files(self.translator, silent=True):
+    def _apply_database_steps(self, timestamp: str) -> bool:
+        """Steps 1-2 of apply_pro_features; both write state.vscdb so they run in order"""
+        # Step 1: Update Pro tier in database
+        success = self.update_pro_tier_database(silent=True, timestamp=timestamp)
+
+        # Step 2: Reset token limits
+        try:
+            from reset_machine_id import reset_token_limits
+            if not reset_token_limits(None, self.ui_manager):  # Pass None for translator to suppress output
                 success = False
+        except Exception:
+            success = False
 
-            return success
+        return success
+
+    def _apply_file_steps(self, timestamp: str, skip_per_file_backup: bool) -> bool:
+        """Steps 4-5 of apply_pro_features; the UI pass walks the workbench's folder so they run in order"""
+        success = True
 
+        # Step 4: Apply workbench modifications
+        try:
+            workbench_path = get_workbench_cursor_path()
+            if not modify_workbench_js(workbench_path, silent=True, ui_manager=self.ui_manager, timestamp=timestamp,
+                                       skip_per_file_backup=skip_per_file_backup):
+                success = False
         except Exception:
-            return False
+            success = False
+
+        # Step 5: Apply comprehensive UI modifications
+        if not modify_ui_files(silent=True, ui_manager=self.ui_manager, timestamp=timestamp,
+                               skip_per_file_backup=skip_per_file_backup):
+            success = False
+
+        return success
+
+    def _verbose_steps(self, timestamp: str, skip_per_file_backup: bool) -> list:
+        """Steps 1-5 of apply_pro_features_verbose as (label key, label, step, error key, error label)"""
+        def reset_tokens():
+            from reset_machine_id import reset_token_limits
+            return reset_token_limits(self.translator)
+
+        return [
+            ('pro.step1', 'Step 1: Updating Pro tier and usage data',
+             lambda: self.update_pro_tier_database(timestamp=timestamp),
+             'pro.process_error', 'Process error: {error}'),
+            ('pro.step2', 'Step 2: Resetting token limits',
+             reset_tokens,
+             'pro.token_reset_failed', 'Token reset failed: {error}'),
+            ('pro.step3', 'Step 3: Updating storage configuration',
+             lambda: self.update_storage_config(timestamp=timestamp),
+             'pro.process_error', 'Process error: {error}'),
+            ('pro.step4', 'Step 4: Applying workbench modifications',
+             lambda: modify_workbench_js(get_workbench_cursor_path(), self.translator, timestamp=timestamp,
+                                         skip_per_file_backup=skip_per_file_backup),
+             'pro.workbench_failed', 'Workbench modification failed: {error}'),
+            ('pro.step5', 'Step 5: Applying comprehensive UI modifications',
+             lambda: modify_ui_files(self.translator, timestamp=timestamp, skip_per_file_backup=skip_per_file_backup),
+             'pro.process_error', 'Process error: {error}'),
+        ]
 
     def apply_pro_features_verbose(self) -> bool:
         """Apply all Pro features and UI modifications with detailed output"""
         try:
             print(f"\n{Fore.CYAN}{'='*50}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}🚀 {self.translator.get('pro.title') if self.translator else 'Applying Pro UI Features'}{Style.RESET_ALL}")
+            print(f"{Fore.CYAN}🚀 {self._t('pro.title', 'Applying Pro UI Features')}{Style.RESET_ALL}")
             print(f"{Fore.CYAN}{'='*50}{Style.RESET_ALL}")
 
             success = True
 
+            # Every backup taken during this run shares one timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
             # Step 0: Create backup before applying changes (if enabled)
             create_backup = config.get_setting('ProFeatures', 'create_backup_before_apply', 'true').lower() == 'true'
             if create_backup:
-                print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step0') if self.translator else 'Step 0: Creating backup before applying changes'}...{Style.RESET_ALL}")
-                backup_name = self.backup_manager.create_full_backup()
+                print(f"{Fore.CYAN}ℹ {self._t('pro.step0', 'Step 0: Creating backup before applying changes')}...{Style.RESET_ALL}")
+                backup_name = self.backup_manager.create_full_backup(timestamp=timestamp)
                 if backup_name:
-                    print(f"{Fore.GREEN}✓ {self.translator.get('pro.backup_created_before_apply', name=backup_name) if self.translator else f'Backup created: {backup_name}'}{Style.RESET_ALL}")
+                    print(f"{Fore.GREEN}✓ {self._t('pro.backup_created_before_apply', f'Backup created: {backup_name}', name=backup_name)}{Style.RESET_ALL}")
                 else:
-                    print(f"{Fore.YELLOW}⚠ {self.translator.get('pro.backup_failed_continue') if self.translator else 'Backup creation failed, but continuing with Pro features application'}{Style.RESET_ALL}")
+                    print(f"{Fore.YELLOW}⚠ {self._t('pro.backup_failed_continue', 'Backup creation failed, but continuing with Pro features application')}{Style.RESET_ALL}")
             else:
-                print(f"{Fore.YELLOW}ℹ {self.translator.get('pro.backup_disabled') if self.translator else 'Automatic backup is disabled in settings'}{Style.RESET_ALL}")
+                print(f"{Fore.YELLOW}ℹ {self._t('pro.backup_disabled', 'Automatic backup is disabled in settings')}{Style.RESET_ALL}")
 
-            # Step 1: Update Pro tier in database
-            print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step1') if self.translator else 'Step 1: Updating Pro tier and usage data'}...{Style.RESET_ALL}")
-            if not self.update_pro_tier_database():
-                success = False
-
-            # Step 2: Reset token limits
-            print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step2') if self.translator else 'Step 2: Resetting token limits'}...{Style.RESET_ALL}")
-            try:
-                from reset_machine_id import reset_token_limits
-                if not reset_token_limits(self.translator):
-                    success = False
-            except Exception as e:
-                print(f"{Fore.RED}✗ {self.translator.get('pro.token_reset_failed', error=str(e)) if self.translator else f'Token reset failed: {e}'}{Style.RESET_ALL}")
-                success = False
-
-            # Step 3: Update storage configuration
-            print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step3') if self.translator else 'Step 3: Updating storage configuration'}...{Style.RESET_ALL}")
-            if not self.update_storage_config():
-                success = False
+            # A complete full backup already holds the workbench and UI files, so they skip their own copies
+            skip_per_file_backup = create_backup and self.backup_manager.last_backup_complete
 
-            # Step 4: Apply workbench modifications
-            print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step4') if self.translator else 'Step 4: Applying workbench modifications'}...{Style.RESET_ALL}")
-            try:
-                workbench_path = get_workbench_cursor_path()
-                if not modify_workbench_js(workbench_path, self.translator):
+            for label_key, label, step, error_key, error_label in self._verbose_steps(timestamp, skip_per_file_backup):
+                print(f"{Fore.CYAN}ℹ {self._t(label_key, label)}...{Style.RESET_ALL}")
+                try:
+                    if not step():
+                        success = False
+                except Exception as e:
+                    print(f"{Fore.RED}✗ {self._t(error_key, error_label.format(error=e), error=str(e))}{Style.RESET_ALL}")
                     success = False
-            except Exception as e:
-                print(f"{Fore.RED}✗ {self.translator.get('pro.workbench_failed', error=str(e)) if self.translator else f'Workbench modification failed: {e}'}{Style.RESET_ALL}")
-                success = False
-
-            # Step 5: Apply comprehensive UI modifications
-            print(f"{Fore.CYAN}ℹ {self.translator.get('pro.step5') if self.translator else 'Step 5: Applying comprehensive UI modifications'}...{Style.RESET_ALL}")
-            if not modify_ui_files(self.translator):
-                success = False
 
             if success:
-                print(f"{Fore.GREEN}✓ {self.translator.get('pro.success') if self.translator else 'Pro UI features applied successfully'}{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}✓ {self._t('pro.success', 'Pro UI features applied successfully')}{Style.RESET_ALL}")
             else:
-                print(f"{Fore.YELLOW}⚠ {self.translator.get('pro.partial_success') if self.translator else 'Pro UI features applied with some warnings'}{Style.RESET_ALL}")
+                print(f"{Fore.YELLOW}⚠ {self._t('pro.partial_success', 'Pro UI features applied with some warnings')}{Style.RESET_ALL}")
 
             return success
 
         except Exception as e:
-            print(f"{Fore.RED}✗ {self.translator.get('pro.process_error', error=str(e)) if self.translator else f'Process error: {e}'}{Style.RESET_ALL}")
+            print(f"{Fore.RED}✗ {self._t('pro.process_error', f'Process error: {e}', error=str(e))}{Style.RESET_ALL}")
             return False
 
 def run(translator=None):
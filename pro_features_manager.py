@@ -3,7 +3,6 @@ Pro UI Features Manager for Cursor-Tools
 Integrates Pro UI features functionality into the main application
 """
 
-from datetime import datetime
 from pro_features import ProUIFeaturesManager
 from ui_manager import UIManager
 from language_manager import language_manager
@@ -12,6 +11,9 @@ class ProUIFeaturesMenuManager:
     def __init__(self):
         self.ui_manager = UIManager()
         self.pro_features_manager = ProUIFeaturesManager()
+        # ((language, console width), rendered segments) of the sub-menu; its contents only
+        # change with the language, its layout with the terminal width
+        self._menu_render_cache = None
 
     def run_pro_ui_features_menu(self):
         """Run the Pro UI Features sub-menu"""
@@ -38,8 +40,15 @@ class ProUIFeaturesMenuManager:
 
     def display_pro_ui_features_menu(self):
         """Display the Pro UI Features sub-menu with language support"""
+        console = self.ui_manager.console
+        cache_key = (self.ui_manager.lang.get_current_language(), console.width)
+        if self._menu_render_cache and self._menu_render_cache[0] == cache_key:
+            console.print(self._menu_render_cache[1])
+            return
+
         from rich.table import Table
         from rich.panel import Panel
+        from rich.segment import Segments
 
         menu_table = Table(show_header=False, box=None, padding=(0, 2))
         menu_table.add_column("Option", style="cyan", width=4)
@@ -56,7 +65,11 @@ class ProUIFeaturesMenuManager:
             padding=(1, 2)
         )
 
-        self.ui_manager.console.print(menu_panel)
+        # Keep the laid-out segments so redraws skip markup parsing and width measurement
+        menu_segments = Segments(list(console.render(menu_panel, console.options)))
+        self._menu_render_cache = (cache_key, menu_segments)
+
+        console.print(menu_segments)
 
     def apply_all_pro_features(self):
         """Apply all Pro UI features and modifications"""
@@ -111,23 +124,12 @@ class ProUIFeaturesMenuManager:
         backup_table.add_column("Description", style="white")
 
         for i, backup in enumerate(backups, 1):
-            # Format timestamp
-            try:
-                timestamp = backup["timestamp"]
-                if timestamp != "unknown":
-                    date_obj = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                    formatted_date = date_obj.strftime("%Y-%m-%d %H:%M")
-                else:
-                    formatted_date = "Unknown"
-            except:
-                formatted_date = "Unknown"
-
             backup_table.add_row(
                 str(i),
-                backup["name"][:30] + "..." if len(backup["name"]) > 30 else backup["name"],
-                formatted_date,
+                backup["display_name"],
+                backup["formatted_date"],
                 str(backup["file_count"]),
-                backup["description"][:40] + "..." if len(backup["description"]) > 40 else backup["description"]
+                backup["display_desc"]
             )
 
         backup_panel = Panel(
@@ -144,7 +146,7 @@ class ProUIFeaturesMenuManager:
             prompt_msg = self.ui_manager.lang.get_text('pro.select_backup', count=len(backups))
             choice = self.ui_manager.get_user_choice(
                 prompt_msg,
-                valid_choices=[str(i) for i in range(1, len(backups) + 1)] + ["c", "C"]
+                valid_choices={str(i) for i in range(1, len(backups) + 1)} | {"c", "C"}
             )
 
             if choice is None or choice.lower() == 'c':
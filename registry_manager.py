@@ -4,22 +4,46 @@ Handles Windows registry operations, backup, and restore functionality
 """
 
 import winreg
-import json
 import os
+import re
 import uuid
 from datetime import datetime
 from typing import Dict, Any
 from config import config
-from utils import AdminPrivilegeManager, BackupManager
+from utils import AdminPrivilegeManager, FileManager, RegistryTransaction, RegistryChangeWatch, format_backup_timestamp
 from ui_manager import UIManager
 
+# Registry backup file names carry their creation time
+_BACKUP_NAME_RE = re.compile(r"registry_backup_(\d{8}_\d{6})\.json")
+
+# Registry value type for each Python type a backup value can hold, looked up by exact type
+_REG_TYPE = {
+    str: winreg.REG_SZ,
+    int: winreg.REG_DWORD,
+    bool: winreg.REG_DWORD,
+    bytes: winreg.REG_BINARY,
+}
+
 class RegistryManager:
     def __init__(self):
         # Use centralized configuration
         self.backup_dir = config.backups_dir
         self.registry_paths = config.registry_paths
+
+        # (path, value names) read by read_registry_values, fixed for the session by config
+        self._read_plan = tuple(
+            (path, tuple(config.target_values.get(path, ()))) for path in self.registry_paths.values()
+        )
         self.ui_manager = UIManager()
-        self.backup_manager = BackupManager(self.backup_dir)
+
+        # Last backup listing, stored with the backup directory's mtime it was built at
+        self._backups_cache = None
+
+        # Open HKLM subkey handles by (path, access), kept for the manager's lifetime
+        self._key_handles = {}
+
+        # path -> (change watch, values) from read_registry_values; re-read only once the key changes
+        self._read_cache = {}
 
         # Directory creation is handled by config initialization
         # No need to create directories here as config already ensures they exist
@@ -28,30 +52,50 @@ class RegistryManager:
         """Check if the application is running with administrator privileges"""
         return AdminPrivilegeManager.check_admin_privileges()
 
+    def _get_key(self, path: str, access: int):
+        """Cached HKLM subkey handle for the path and access, opened on first use"""
+        key = self._key_handles.get((path, access))
+        if key is None:
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, access)
+            self._key_handles[(path, access)] = key
+        return key
+
+    def close(self):
+        """Close every cached registry key handle"""
+        for watch, _ in self._read_cache.values():
+            watch.close()
+        self._read_cache.clear()
+        for key in self._key_handles.values():
+            winreg.CloseKey(key)
+        self._key_handles.clear()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def read_registry_values(self) -> Dict[str, Dict[str, Any]]:
         """Read current registry values from all target locations"""
         values = {}
 
-        # Use centralized target values configuration
-        target_values = config.target_values
-
-        for _, path in self.registry_paths.items():
+        for path, target_keys in self._read_plan:
             values[path] = {}
             try:
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ)
+                cached = self._read_cache.get(path)
+                if cached and not cached[0].changed():
+                    values[path] = dict(cached[1])
+                    continue
 
-                # Only read the specific values we're interested in
-                target_keys = target_values.get(path, [])
-                for target_key in target_keys:
-                    try:
-                        value_data, _ = winreg.QueryValueEx(key, target_key)
-                        values[path][target_key] = value_data
-                    except FileNotFoundError:
-                        values[path][target_key] = "Not found"
-                    except Exception as e:
-                        values[path][target_key] = f"Error: {str(e)}"
+                key = self._get_key(path, winreg.KEY_READ)
 
-                winreg.CloseKey(key)
+                # Watch before reading, so a change made during the read invalidates it
+                watch = cached[0] if cached else self._watch_key(key)
+
+                # Only read the specific values we're interested in
+                values[path] = self._query_values(key, target_keys)
+                if watch is not None:
+                    self._read_cache[path] = (watch, dict(values[path]))
 
             except FileNotFoundError:
                 values[path] = {"Error": "Registry path not found"}
@@ -62,35 +106,61 @@ class RegistryManager:
 
         return values
 
-    def create_backup(self) -> str:
-        """Create a backup of current registry values using centralized BackupManager"""
+    @staticmethod
+    def _watch_key(key):
+        """Change watch for the key, or None if notifications are unavailable (nothing is cached then)"""
+        try:
+            return RegistryChangeWatch(key)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _query_values(key, target_keys) -> Dict[str, Any]:
+        """Read the given values from an open registry key"""
+        # Enumerate the key's values once so a missing value is a dict miss rather than
+        # a raised FileNotFoundError; the value count bounds the loop without an end-of-items error.
+        # Value names are case-insensitive, as QueryValueEx treats them, so they are matched casefolded
+        try:
+            value_count = winreg.QueryInfoKey(key)[1]
+            present = {name.casefold(): data
+                       for name, data, _ in (winreg.EnumValue(key, index) for index in range(value_count))}
+        except OSError:
+            present = None
+
+        if present is not None:
+            return {target_key: present.get(target_key.casefold(), "Not found") for target_key in target_keys}
+
+        # Values changed while enumerating - query them one by one
+        values = {}
+        for target_key in target_keys:
+            try:
+                value_data, _ = winreg.QueryValueEx(key, target_key)
+                values[target_key] = value_data
+            except FileNotFoundError:
+                values[target_key] = "Not found"
+            except Exception as e:
+                values[target_key] = f"Error: {str(e)}"
+        return values
+
+    def create_backup(self, current_values: Dict[str, Dict[str, Any]] = None) -> str:
+        """Create a backup of current registry values and return its path"""
         try:
-            current_values = self.read_registry_values()
-
-            # Create a temporary file with registry data
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                backup_data = {
-                    "backup_date": datetime.now().isoformat(),
-                    "registry_values": current_values
-                }
-                json.dump(backup_data, temp_file, indent=2, default=str)
-                temp_path = temp_file.name
-
-            # Use centralized backup manager
-            backup_id = self.backup_manager.create_backup(
-                temp_path,
-                "registry_backup",
-                {"backup_type": "registry", "values_count": len(current_values)}
-            )
-
-            # Clean up temporary file
-            os.unlink(temp_path)
-
-            if backup_id:
-                return backup_id
-            else:
-                raise Exception("Failed to create backup using BackupManager")
+            # Callers that just read the values pass them in instead of reading them again
+            if current_values is None:
+                current_values = self.read_registry_values()
+
+            backup_data = {
+                "backup_date": datetime.now().isoformat(),
+                "registry_values": current_values
+            }
+
+            # Serialized once and published atomically as the file list_backups and restore_backup
+            # read; the temporary ".json.tmp" file never matches the backup file name pattern
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = os.path.join(self.backup_dir, f"registry_backup_{timestamp}.json")
+            FileManager.write_json(backup_path, backup_data, default=str, atomic=True)
+
+            return backup_path
 
         except Exception as e:
             raise Exception(f"Failed to create backup: {str(e)}")
@@ -98,30 +168,30 @@ class RegistryManager:
     def restore_backup(self, backup_path: str) -> bool:
         """Restore registry values from backup"""
         try:
-            with open(backup_path, 'r') as f:
-                backup_data = json.load(f)
+            backup_data = FileManager.read_json(backup_path)
 
             registry_values = backup_data.get("registry_values", {})
 
-            for path, values in registry_values.items():
-                if "Error" in values:
-                    continue
+            # Every value goes through one registry transaction, so a failure part way
+            # through leaves the registry as it was instead of half-restored
+            with RegistryTransaction() as transaction:
+                for path, values in registry_values.items():
+                    if "Error" in values:
+                        continue
 
-                try:
-                    key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0,
-                                       winreg.KEY_WRITE)
+                    try:
+                        key = transaction.open_key(winreg.HKEY_LOCAL_MACHINE, path, winreg.KEY_WRITE)
 
-                    for value_name, value_data in values.items():
-                        if isinstance(value_data, str):
-                            winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, value_data)
-                        elif isinstance(value_data, int):
-                            winreg.SetValueEx(key, value_name, 0, winreg.REG_DWORD, value_data)
-                        # Add more type handling as needed
+                        for value_name, value_data in values.items():
+                            value_type = _REG_TYPE.get(type(value_data))
+                            # Other types (e.g. None) have no registry value to write back
+                            if value_type is not None:
+                                winreg.SetValueEx(key, value_name, 0, value_type, value_data)
 
-                    winreg.CloseKey(key)
+                    except Exception as e:
+                        raise Exception(f"Failed to restore {path}: {str(e)}")
 
-                except Exception as e:
-                    raise Exception(f"Failed to restore {path}: {str(e)}")
+                transaction.commit()
 
             return True
 
@@ -132,44 +202,56 @@ class RegistryManager:
         """Generate new device IDs for registry modification"""
         new_ids = {}
 
+        # One read from the system CSPRNG for all three IDs instead of one per uuid4() call
+        random_bytes = os.urandom(48)
+        machine_guid, hw_profile_guid, machine_id = (
+            str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4)).upper() for i in (0, 16, 32)
+        )
+
         # Generate new values for Cryptography - only MachineGuid
         new_ids[self.registry_paths["cryptography"]] = {
-            "MachineGuid": str(uuid.uuid4()).upper()
+            "MachineGuid": machine_guid
         }
 
         # Generate new values for Hardware Profiles - only HwProfileGuid
         new_ids[self.registry_paths["hardware_profiles"]] = {
-            "HwProfileGuid": "{" + str(uuid.uuid4()).upper() + "}"
+            "HwProfileGuid": "{" + hw_profile_guid + "}"
         }
 
         # Generate new values for SQM Client - only MachineId
         new_ids[self.registry_paths["sqm_client"]] = {
-            "MachineId": "{" + str(uuid.uuid4()).upper() + "}"
+            "MachineId": "{" + machine_id + "}"
         }
 
         return new_ids
 
     def modify_device_ids(self) -> tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
         """Modify device IDs in registry and return before/after values"""
-        # Get current values (before)
-        before_values = self.read_registry_values()
-
-        # Create backup before making changes
-        backup_path = self.create_backup()
+        target_values = config.target_values
 
         # Generate new IDs
         new_ids = self.generate_new_device_ids()
 
+        # Each key is opened for reading and writing once per manager; the same handle
+        # serves the before snapshot, the changes and the after snapshot
+        keys = {}
+        for path in new_ids:
+            try:
+                keys[path] = self._get_key(path, winreg.KEY_READ | winreg.KEY_WRITE)
+            except Exception as e:
+                raise Exception(f"Failed to modify {path}: {str(e)}")
+
+        # Get current values (before)
+        before_values = {path: self._query_values(key, target_values.get(path, [])) for path, key in keys.items()}
+
+        # Create backup before making changes
+        backup_path = self.create_backup(before_values)
+
         # Apply changes
         for path, new_values in new_ids.items():
             try:
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0,
-                                   winreg.KEY_WRITE)
-
                 for value_name, value_data in new_values.items():
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, value_data)
-
-                winreg.CloseKey(key)
+                    winreg.SetValueEx(keys[path], value_name, 0, winreg.REG_SZ, value_data)
 
             except Exception as e:
                 # If any modification fails, attempt to restore backup
@@ -180,52 +262,65 @@ class RegistryManager:
                 raise Exception(f"Failed to modify {path}: {str(e)}")
 
         # Get new values (after)
-        after_values = self.read_registry_values()
+        after_values = {path: self._query_values(key, target_values.get(path, [])) for path, key in keys.items()}
 
         return before_values, after_values
 
     def list_backups(self) -> list:
         """List available backup files with detailed information"""
+        try:
+            # Backups are only ever added or removed, and either changes the directory's mtime
+            dir_mtime_ns = os.stat(self.backup_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if self._backups_cache and self._backups_cache[0] == dir_mtime_ns:
+            return list(self._backups_cache[1])
+
         backups = []
-        if os.path.exists(self.backup_dir):
-            for filename in os.listdir(self.backup_dir):
-                if filename.endswith('.json') and filename.startswith('registry_backup_'):
-                    backup_path = os.path.join(self.backup_dir, filename)
-                    try:
-                        with open(backup_path, 'r') as f:
-                            backup_data = json.load(f)
-
-                        # Count registry entries
-                        registry_values = backup_data.get('registry_values', {})
-                        file_count = 0
-                        for path_values in registry_values.values():
-                            if isinstance(path_values, dict) and "Error" not in path_values:
-                                file_count += len(path_values)
-
-                        # Format timestamp for display
-                        timestamp = backup_data.get('timestamp', 'Unknown')
-                        try:
-                            if timestamp != 'Unknown':
-                                date_obj = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                                formatted_date = date_obj.strftime("%Y-%m-%d %H:%M")
-                            else:
-                                formatted_date = "Unknown"
-                        except:
-                            formatted_date = "Unknown"
-
-                        backups.append({
-                            'name': filename.replace('.json', '').replace('registry_backup_', 'device_id_backup_'),
-                            'filename': filename,
-                            'path': backup_path,
-                            'date': backup_data.get('backup_date', 'Unknown'),
-                            'timestamp': timestamp,
-                            'formatted_date': formatted_date,
-                            'file_count': file_count,
-                            'description': f"Device ID registry backup with {file_count} registry entries"
-                        })
-                    except:
-                        continue
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (filename.endswith('.json') and filename.startswith('registry_backup_')) or not entry.is_file():
+                    continue
+
+                backup_path = entry.path
+                try:
+                    backup_data = FileManager.read_json(backup_path)
+
+                    # Count registry entries
+                    registry_values = backup_data.get('registry_values', {})
+                    file_count = 0
+                    for path_values in registry_values.values():
+                        if isinstance(path_values, dict) and "Error" not in path_values:
+                            file_count += len(path_values)
+
+                    # Take the timestamp from the file name
+                    name_match = _BACKUP_NAME_RE.fullmatch(filename)
+                    timestamp = name_match.group(1) if name_match else backup_data.get('timestamp', 'Unknown')
+
+                    # Format timestamp for display
+                    formatted_date = format_backup_timestamp(timestamp)
+
+                    name = filename.replace('.json', '').replace('registry_backup_', 'device_id_backup_')
+                    description = f"Device ID registry backup with {file_count} registry entries"
+
+                    backups.append({
+                        'name': name,
+                        'filename': filename,
+                        'path': backup_path,
+                        'date': backup_data.get('backup_date', 'Unknown'),
+                        'timestamp': timestamp,
+                        'formatted_date': formatted_date,
+                        'file_count': file_count,
+                        'description': description,
+                        # Truncated fields for the restore table
+                        'display_name': name if len(name) <= 30 else name[:30] + "...",
+                        'display_desc': description if len(description) <= 40 else description[:40] + "..."
+                    })
+                except:
+                    continue
 
         # Sort by timestamp (newest first)
         backups.sort(key=lambda x: x['timestamp'], reverse=True)
-        return backups
+        self._backups_cache = (dir_mtime_ns, backups)
+        return list(backups)
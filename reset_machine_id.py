@@ -10,13 +10,19 @@ import hashlib
 import shutil
 import sqlite3
 import re
-import tempfile
 from colorama import Fore, Style
 from config import config
 from datetime import datetime
-from utils import get_cursor_paths, get_workbench_cursor_path, version_check, PathManager, VersionManager
+from utils import get_cursor_paths, get_workbench_cursor_path, version_check, PathManager, VersionManager, LiteralReplacer, FileManager
 from ui_manager import UIManager
 
+# Workbench replacements built once at import; applied key by key in table order, one replace scan per pattern
+_WB_REPLACER = LiteralReplacer(config.reset_machine_id_patterns)
+
+# main.js patterns compiled once at import instead of going through re's cache on every call
+_MAIN_JS_PATTERNS = tuple((re.compile(pattern), replacement)
+                          for pattern, replacement in config.reset_main_js_patterns.items())
+
 
 
 # Removed get_cursor_machine_id_path() - now using utils.PathManager.get_cursor_machine_id_path()
@@ -39,32 +45,25 @@ def modify_workbench_js(file_path: str, translator=None, ui_manager=None) -> boo
         original_stat = os.stat(file_path)
         original_mode = original_stat.st_mode
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", errors="ignore", delete=False) as tmp_file:
-            # Read original content
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as main_file:
-                content = main_file.read()
-
-            patterns = config.reset_machine_id_patterns
+        # Read original content
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as main_file:
+            content = main_file.read()
 
-            # Use patterns from config for replacements
-            for old_pattern, new_pattern in patterns.items():
-                content = content.replace(old_pattern, new_pattern)
+        # Use patterns from config for replacements
+        content = _WB_REPLACER.replace(content)
 
-            # Write to temporary file
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-
-        # Backup original file with timestamp to centralized backup directory
+        # Backup original file with timestamp to centralized backup directory, before it is overwritten
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_filename = f"workbench.desktop.main.js.backup.{timestamp}"
         backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-        shutil.copy2(file_path, backup_path)
+        FileManager.fast_copy(file_path, backup_path)
 
-        # Move temporary file to original position
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        shutil.move(tmp_path, file_path)
+        # Write next to the original (same volume) and swap it in with a single rename, so a
+        # failed or interrupted write never leaves Cursor with a truncated file
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", errors="ignore") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, file_path)
 
         # Restore original permissions (Windows-only)
         os.chmod(file_path, original_mode)
@@ -73,10 +72,10 @@ def modify_workbench_js(file_path: str, translator=None, ui_manager=None) -> boo
 
     except Exception as e:
         ui_manager.display_localized_error('reset.modify_file_failed', translator, error=str(e))
-        if "tmp_path" in locals():
+        if "tmp_path" in locals() and os.path.exists(tmp_path):
             try:
                 os.unlink(tmp_path)
-            except:
+            except OSError:
                 pass
         return False
 
@@ -89,23 +88,22 @@ def modify_main_js(main_path: str, translator, ui_manager=None) -> bool:
         original_stat = os.stat(main_path)
         original_mode = original_stat.st_mode
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp_file:
-            with open(main_path, "r", encoding="utf-8") as main_file:
-                content = main_file.read()
+        with open(main_path, "r", encoding="utf-8") as main_file:
+            content = main_file.read()
 
-            patterns = config.reset_main_js_patterns
-
-            for pattern, replacement in patterns.items():
-                content = re.sub(pattern, replacement, content)
-
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
+        for pattern, replacement in _MAIN_JS_PATTERNS:
+            content = pattern.sub(replacement, content)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_filename = f"main.js.backup.{timestamp}"
         backup_path = os.path.join(config.reset_machine_id_paths['reset_backups_dir'], backup_filename)
-        shutil.copy2(main_path, backup_path)
-        shutil.move(tmp_path, main_path)
+        FileManager.fast_copy(main_path, backup_path)
+
+        # Swapped in with a single rename, so main.js is never left half-written
+        tmp_path = main_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, main_path)
 
         os.chmod(main_path, original_mode)
 
@@ -113,8 +111,11 @@ def modify_main_js(main_path: str, translator, ui_manager=None) -> bool:
 
     except Exception as e:
         print(f"{Fore.RED}✗ {translator.get('reset.modify_file_failed', error=str(e)) if translator else f'Failed to modify file: {e}'}{Style.RESET_ALL}")
-        if "tmp_path" in locals():
-            os.unlink(tmp_path)
+        if "tmp_path" in locals() and os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         return False
 
 def patch_cursor_get_machine_id(translator, ui_manager=None) -> bool:
@@ -201,29 +202,31 @@ class MachineIDResetter:
     def update_sqlite_db(self, new_ids):
         """Update machine ID in SQLite database"""
         try:
-            conn = sqlite3.connect(self.sqlite_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ItemTable (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
-
-            # Basic machine ID updates
-            updates = [
-                (key, value) for key, value in new_ids.items()
-            ]
-
-            for key, value in updates:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO ItemTable (key, value)
-                    VALUES (?, ?)
-                """, (key, value))
-
-            conn.commit()
-            conn.close()
+            # Autocommit mode so the one explicit transaction below is the only one
+            conn = sqlite3.connect(self.sqlite_path, isolation_level=None)
+            try:
+                # IMMEDIATE takes the write lock up front (waiting out a running Cursor through
+                # the busy timeout) instead of failing on a lock upgrade halfway through
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS ItemTable (
+                            key TEXT PRIMARY KEY,
+                            value TEXT
+                        )
+                    """)
+
+                    # Basic machine ID updates, one prepared statement for every row
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO ItemTable (key, value)
+                        VALUES (?, ?)
+                    """, new_ids.items())
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
             return True
 
         except Exception as e:
@@ -6,7 +6,7 @@ Integrates reset machine ID functionality into the main application
 import os
 from reset_machine_id import MachineIDResetter
 from ui_manager import UIManager
-from utils import BackupManager
+from utils import BackupManager, format_backup_timestamp
 
 class ResetMachineIDManager:
     def __init__(self):
@@ -165,7 +165,7 @@ class ResetMachineIDManager:
             # Get user selection
             choice = self.ui_manager.get_user_choice(
                 f"Select backup to restore (1-{len(backup_items)}) or 'c' to cancel",
-                valid_choices=[str(i) for i in range(1, len(backup_items) + 1)] + ['c', 'C']
+                valid_choices={str(i) for i in range(1, len(backup_items) + 1)} | {'c', 'C'}
             )
 
             if choice is None or choice.lower() == 'c':
@@ -898,7 +898,6 @@ class ResetMachineIDManager:
         """Display backup files and folders in a structured table panel"""
         from rich.panel import Panel
         from rich.table import Table
-        from datetime import datetime
 
         # Create table for backup items
         backup_table = Table(show_header=True, header_style="bold white", box=None, padding=(0, 1))
@@ -920,15 +919,7 @@ class ResetMachineIDManager:
                 type_display = f"[{color}]Comprehensive[/{color}]"
                 name_display = item['name'][:28] + "..." if len(item['name']) > 28 else item['name']
 
-                # Format timestamp
-                try:
-                    if item['timestamp'] != 'unknown':
-                        timestamp_obj = datetime.strptime(item['timestamp'], "%Y%m%d_%H%M%S")
-                        formatted_timestamp = timestamp_obj.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        formatted_timestamp = "Unknown"
-                except:
-                    formatted_timestamp = "Unknown"
+                formatted_timestamp = format_backup_timestamp(item['timestamp'])
 
                 info_display = f"{item['file_count']} files"
             else:
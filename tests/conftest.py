@@ -0,0 +1,14 @@
+"""
+Test setup for Cursor-Tools: config resolves its paths from the Windows profile
+variables at import, so they are pointed at a scratch directory first
+"""
+
+import os
+import sys
+import tempfile
+
+_PROFILE_DIR = tempfile.mkdtemp(prefix="cursor-tools-tests-")
+for variable in ("APPDATA", "LOCALAPPDATA"):
+    os.environ.setdefault(variable, _PROFILE_DIR)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,12 @@
+"""
+LanguageManager.get_text caching must not mix up parameters that compare equal
+"""
+
+from language_manager import language_manager
+
+
+def test_get_text_cache_keeps_parameter_types_apart():
+    key = "pro.select_backup"
+    assert "(1-1)" in language_manager.get_text(key, count=1)
+    assert "(1-True)" in language_manager.get_text(key, count=True)
+    assert "(1-1.0)" in language_manager.get_text(key, count=1.0)
@@ -0,0 +1,35 @@
+"""
+A repeat apply must leave an already patched workbench alone, even though the
+UI pass over out/ rewrites it after the workbench step
+"""
+
+import pytest
+
+import pro_features
+
+
+@pytest.fixture
+def cursor_tree(tmp_path, monkeypatch):
+    out_dir = tmp_path / "out"
+    (out_dir / "vs").mkdir(parents=True)
+    for name in ("dist", "backups", "pro"):
+        (tmp_path / name).mkdir()
+
+    workbench = out_dir / "vs" / "workbench.desktop.main.js"
+    workbench.write_bytes(b'<div class="notifications-toasts">Pro Trial</div>')
+
+    monkeypatch.setitem(pro_features._PATHS, "ui_out_path", str(out_dir))
+    monkeypatch.setitem(pro_features._PATHS, "ui_dist_path", str(tmp_path / "dist"))
+    monkeypatch.setitem(pro_features._PATHS, "reset_backups_dir", str(tmp_path / "backups"))
+    monkeypatch.setitem(pro_features._PATHS, "pro_backups_dir", str(tmp_path / "pro"))
+    return workbench
+
+
+def test_repeat_apply_skips_workbench_rewritten_by_ui_pass(cursor_tree):
+    for _ in range(2):
+        assert pro_features.modify_workbench_js(str(cursor_tree), silent=True, skip_per_file_backup=True)
+        assert pro_features.modify_ui_files(silent=True, skip_per_file_backup=True)
+
+    content = cursor_tree.read_bytes()
+    assert content.count(b"hidden") == 1
+    assert b"Pro Trial" not in content
@@ -0,0 +1,54 @@
+"""
+Restoring a Pro backup copies every target file once, even when the manifest
+lists it twice (the workbench is also one of the out/ UI files), and only a
+missing backup copy is reported as missing
+"""
+
+import json
+import threading
+
+import pytest
+
+import pro_features
+from utils import FileManager
+
+
+def test_restore_copies_duplicate_target_once(tmp_path, monkeypatch):
+    backup_dir = tmp_path / "pro"
+    backup = backup_dir / "pro_features_full_backup_20260101_000000"
+    (backup / "ui_files" / "out").mkdir(parents=True)
+    (backup / "workbench.desktop.main.js").write_bytes(b"original")
+    (backup / "ui_files" / "out" / "workbench.desktop.main.js").write_bytes(b"original")
+
+    target = tmp_path / "out" / "workbench.desktop.main.js"
+    (backup / "backup_manifest.json").write_text(json.dumps({"files": [
+        {"type": "workbench", "original": str(target), "backup": "workbench.desktop.main.js"},
+        {"type": "ui_file", "original": str(target),
+         "backup": "ui_files/out/workbench.desktop.main.js"},
+    ]}))
+
+    copies = []
+    lock = threading.Lock()
+    fast_copy = FileManager.fast_copy
+
+    def counting_copy(source, destination):
+        with lock:
+            copies.append(destination)
+        return fast_copy(source, destination)
+
+    monkeypatch.setitem(pro_features._PATHS, "pro_backups_dir", str(backup_dir))
+    monkeypatch.setattr(FileManager, "fast_copy", staticmethod(counting_copy))
+
+    manager = pro_features.ProUIFeaturesBackupManager()
+    assert manager.restore_backup(backup.name)
+    assert copies == [str(target)]
+    assert target.read_bytes() == b"original"
+
+
+def test_restore_file_reports_only_a_missing_backup_as_missing(tmp_path):
+    (tmp_path / "copy.js").write_bytes(b"original")
+
+    assert not pro_features._restore_file(str(tmp_path), {"backup": "gone.js", "original": str(tmp_path / "out.js")})
+
+    with pytest.raises(FileNotFoundError):
+        pro_features._restore_file(str(tmp_path), {"backup": "copy.js", "original": str(tmp_path / "no_dir" / "out.js")})
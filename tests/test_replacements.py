@@ -0,0 +1,83 @@
+"""
+The Pro replacement tables must patch files exactly like applying them key by key,
+in table order, with str.replace (the original implementation)
+"""
+
+import random
+
+from config import config
+from utils import LiteralReplacer
+import pro_features
+import reset_machine_id
+
+
+def replace_in_order(content, table):
+    """The original implementation: one str.replace per key, in table order"""
+    for key, value in table.items():
+        content = content.replace(key, value)
+    return content
+
+
+def samples(table, count=3000, seed=7):
+    """Random texts built from the keys, fragments of them and filler, so keys meet and overlap"""
+    rng = random.Random(seed)
+    pieces = list(table) + [key[:len(key) // 2] for key in table] + [key[len(key) // 2:] for key in table]
+    pieces += [" ", "x", '"', "'", "Pro", "Trial", "Start ", "to ", "\n"]
+    yield " | ".join(table)
+    yield "".join(table)
+    for _ in range(count):
+        yield "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+
+
+def test_ui_table_matches_in_order_replace():
+    replacer = LiteralReplacer(config.ui_modification_patterns)
+    for text in samples(config.ui_modification_patterns):
+        assert replacer.replace(text) == replace_in_order(text, config.ui_modification_patterns), text
+
+
+def test_ui_overlapping_keys_resolve_in_table_order():
+    replacer = LiteralReplacer(config.ui_modification_patterns)
+    assert replacer.replace("Upgrade to Pro Trial") == "Pro Unlocked"
+    assert replacer.replace("Start Pro Trial") == "Start Pro"
+
+
+def test_workbench_table_matches_in_order_replace():
+    for replacer in (LiteralReplacer(config.reset_machine_id_patterns), reset_machine_id._WB_REPLACER):
+        for text in samples(config.reset_machine_id_patterns):
+            assert replacer.replace(text) == replace_in_order(text, config.reset_machine_id_patterns), text
+
+
+def test_ui_bytes_table_matches_in_order_replace():
+    table = config.ui_modification_patterns
+    for text in samples(table):
+        assert pro_features._UI_REPLACER.replace(text.encode("utf-8")) == replace_in_order(text, table).encode("utf-8"), text
+
+
+def test_process_ui_file_matches_in_order_replace(tmp_path):
+    table = config.ui_modification_patterns
+    text = "<div>" + " · ".join(table) + " | Upgrade to Pro Trial | Start Pro Trial expired | ü</div>"
+    ui_file = tmp_path / "workbench.html"
+    ui_file.write_bytes(text.encode("utf-8"))
+
+    modified, _ = pro_features._process_ui_file(str(ui_file), None, "20260101_000000")
+
+    assert modified
+    assert ui_file.read_bytes() == replace_in_order(text, table).encode("utf-8")
+
+
+
+def test_subn_counts_only_keys_that_change_content():
+    replacer = LiteralReplacer({"Pro": "Pro", "Free plan": "Pro plan", "x": "y"})
+    assert replacer.subn("Pro, nothing else") == ("Pro, nothing else", 0)
+    assert replacer.subn("Free plan x x") == ("Pro plan y y", 2)
+
+
+def test_idempotent_only_when_no_value_can_form_a_key():
+    assert LiteralReplacer({"cat": "xyz", "bird": "qqq"}).idempotent
+    assert not LiteralReplacer({"cat": "xyz", "bird": "dog"}).idempotent  # "bir" + "dog"
+    assert not LiteralReplacer({"Pro Trial": "Pro"}).idempotent
+    assert not LiteralReplacer({"ab": "b"}).idempotent
+    assert not LiteralReplacer({"x": ""}).idempotent
+    assert not LiteralReplacer(config.ui_modification_patterns).idempotent
+    replacer = LiteralReplacer(config.ui_modification_patterns)
+    assert replacer.subn(replacer.replace("Pro Trial Trial"))[1]
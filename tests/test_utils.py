@@ -0,0 +1,23 @@
+"""
+Backup timestamps are shown exactly as the strptime/strftime round trip showed them
+"""
+
+from datetime import datetime
+
+from utils import format_backup_timestamp
+
+
+def strptime_format(timestamp):
+    """The original implementation"""
+    try:
+        return datetime.strptime(timestamp, "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return "Unknown"
+
+
+def test_format_backup_timestamp_matches_strptime():
+    for timestamp in ("20260101_000000", "20241231_235959", "20240229_120000", "20230229_120000",
+                      "20261301_000000", "20260100_000000", "20260431_000000", "20260101_250000",
+                      "20260101_006000", "20260101_000060", "00000101_000000", "2026010_0000000",
+                      "２０２６0101_000000", "20260101-000000", "unknown", "", None, 20260101):
+        assert format_backup_timestamp(timestamp) == strptime_format(timestamp), timestamp
@@ -14,14 +14,20 @@ from rich.prompt import Prompt, Confirm
 from rich.align import Align
 from language_manager import language_manager
 
+# ANSI erase display + scrollback, then cursor home. main.py's colorama setup makes the
+# Windows console process it (natively where supported, translated otherwise)
+CLEAR_SCREEN_SEQUENCE = "\x1b[2J\x1b[3J\x1b[H"
+
 class UIManager:
     def __init__(self):
         self.console = Console()
         self.lang = language_manager
 
     def clear_screen(self):
-        """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen without spawning a shell"""
+        out = self.console.file
+        out.write(CLEAR_SCREEN_SEQUENCE)
+        out.flush()
 
     def display_header(self):
         """Display application header with language support"""
@@ -61,6 +67,17 @@ class UIManager:
 
         self.console.print(menu_panel)
 
+    def render_main_screen(self):
+        """Clear the screen and draw the header and main menu with a single console write"""
+        with self.console.capture() as capture:
+            self.display_header()
+            self.display_main_menu()
+
+        # The clear sequence is prepended so the whole frame goes out in one write
+        out = self.console.file
+        out.write(CLEAR_SCREEN_SEQUENCE + capture.get())
+        out.flush()
+
     def display_language_menu(self):
         """Display the language settings menu"""
         menu_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -166,7 +183,7 @@ class UIManager:
         self.console.print(menu_panel)
 
     def get_user_choice(self, prompt_key="menu.select_option", valid_choices=None):
-        """Get user input with validation and language support"""
+        """Get user input with validation and language support (valid_choices may be any container, e.g. a set)"""
         while True:
             try:
                 prompt_text = self.lang.get_text(prompt_key)
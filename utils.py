@@ -5,42 +5,140 @@ Centralized utility functions to reduce code duplication across the codebase
 
 import os
 import sys
-import ctypes
 import re
 import json
-import winreg
+import mmap
 from typing import Tuple, Optional
 from config import config
 
+# orjson is optional; it encodes straight to bytes and is several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+IS_WINDOWS = os.name == 'nt'
+# PyInstaller/Nuitka executables embed a requireAdministrator manifest, so Windows
+# elevates them at process creation and the re-launch below is only needed from source
+IS_FROZEN = getattr(sys, 'frozen', False)
+
+if IS_WINDOWS:
+    import ctypes
+    import winreg
+    from ctypes import wintypes
+
+    # shell32 entry points bound once with explicit prototypes instead of going through ctypes.windll per call
+    _shell32 = ctypes.WinDLL('shell32', use_last_error=True)
+
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = wintypes.BOOL
+
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                               wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.INT]
+    _ShellExecuteW.restype = wintypes.HINSTANCE
+
+    # CopyFileW copies data, attributes and timestamps inside the kernel (block clone on ReFS)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    _CopyFileW = _kernel32.CopyFileW
+    _CopyFileW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    _CopyFileW.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
+    # Kernel Transaction Manager: registry keys opened under one transaction have all their
+    # writes made visible by a single commit, or discarded by a rollback
+    _ktmw32 = ctypes.WinDLL('ktmw32', use_last_error=True)
+
+    _CreateTransaction = _ktmw32.CreateTransaction
+    _CreateTransaction.argtypes = [wintypes.LPVOID, wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD,
+                                   wintypes.DWORD, wintypes.DWORD, wintypes.LPWSTR]
+    _CreateTransaction.restype = wintypes.HANDLE
+
+    _CommitTransaction = _ktmw32.CommitTransaction
+    _CommitTransaction.argtypes = [wintypes.HANDLE]
+    _CommitTransaction.restype = wintypes.BOOL
+
+    _RollbackTransaction = _ktmw32.RollbackTransaction
+    _RollbackTransaction.argtypes = [wintypes.HANDLE]
+    _RollbackTransaction.restype = wintypes.BOOL
+
+    _advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+
+    _RegOpenKeyTransactedW = _advapi32.RegOpenKeyTransactedW
+    _RegOpenKeyTransactedW.argtypes = [wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+                                       ctypes.POINTER(wintypes.HKEY), wintypes.HANDLE, wintypes.LPVOID]
+    _RegOpenKeyTransactedW.restype = wintypes.LONG
+
+    _RegCloseKey = _advapi32.RegCloseKey
+    _RegCloseKey.argtypes = [wintypes.HKEY]
+    _RegCloseKey.restype = wintypes.LONG
+
+    # Change notifications: an event signalled when a watched key's values are set
+    _RegNotifyChangeKeyValue = _advapi32.RegNotifyChangeKeyValue
+    _RegNotifyChangeKeyValue.argtypes = [wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL]
+    _RegNotifyChangeKeyValue.restype = wintypes.LONG
+
+    _CreateEventW = _kernel32.CreateEventW
+    _CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+    _CreateEventW.restype = wintypes.HANDLE
+
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _WaitForSingleObject.restype = wintypes.DWORD
+
+    _REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+    _WAIT_OBJECT_0 = 0
+
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    # Elevation re-launch parameters, resolved once (before anything can change the cwd);
+    # a frozen executable is its own entry point and takes no script argument.
+    # The elevated interpreter doesn't write bytecode (-B) and skips the user site-packages
+    # lookup (-s) when this one isn't using it; -S is not an option since rich/colorama
+    # are imported from site-packages
+    if IS_FROZEN:
+        _ELEVATION_PARAMS = None
+    else:
+        import site
+        _INTERPRETER_FLAGS = '-B' if site.USER_SITE in sys.path else '-B -s'
+        _ELEVATION_PARAMS = _INTERPRETER_FLAGS + ' "' + os.path.abspath(sys.argv[0]) + '"'
+
 
 class AdminPrivilegeManager:
     """Centralized admin privilege management"""
 
-    @staticmethod
-    def is_admin() -> bool:
+    # Elevation can't change during the process lifetime, so it is queried once
+    _is_admin_cached = None
+
+    @classmethod
+    def is_admin(cls) -> bool:
         """Check if the current process has administrator privileges"""
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        if cls._is_admin_cached is None:
+            try:
+                if IS_WINDOWS:
+                    cls._is_admin_cached = bool(_IsUserAnAdmin())
+                else:
+                    cls._is_admin_cached = os.geteuid() == 0
+            except OSError:
+                cls._is_admin_cached = False
+        return cls._is_admin_cached
 
     @staticmethod
     def run_as_admin() -> bool:
         """Restart the current script with administrator privileges"""
-        try:
-            # Get the current script path
-            script_path = os.path.abspath(sys.argv[0])
+        if not IS_WINDOWS:
+            return False
 
+        try:
             # Use ShellExecute to run with elevated privileges
-            ctypes.windll.shell32.ShellExecuteW(
-                None,
-                "runas",
-                sys.executable,
-                f'"{script_path}"',
-                None,
-                1
-            )
-            return True
+            result = _ShellExecuteW(None, "runas", sys.executable, _ELEVATION_PARAMS, None, 1)
+            # Values <= 32 are error codes (e.g. the UAC prompt was declined)
+            return (result or 0) > 32
         except Exception:
             return False
 
@@ -60,6 +158,76 @@ class AdminPrivilegeManager:
             return False
 
 
+class RegistryTransaction:
+    """Registry writes committed together or not at all (Windows Kernel Transaction Manager)"""
+
+    def __init__(self):
+        self._handle = _CreateTransaction(None, None, 0, 0, 0, 0, None)
+        if self._handle in (None, _INVALID_HANDLE_VALUE):
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._keys = []
+        self._committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for key in self._keys:
+            _RegCloseKey(key)
+        # Anything not committed (an exception, or no commit() call) is discarded
+        if not self._committed:
+            _RollbackTransaction(self._handle)
+        _CloseHandle(self._handle)
+        return False
+
+    def open_key(self, root, sub_key: str, access: int) -> int:
+        """Open a key whose changes belong to this transaction; usable wherever winreg takes a key"""
+        key = wintypes.HKEY()
+        result = _RegOpenKeyTransactedW(root, sub_key, 0, access, ctypes.byref(key), self._handle, None)
+        if result != 0:
+            raise ctypes.WinError(result)
+        self._keys.append(key.value)
+        return key.value
+
+    def commit(self) -> None:
+        """Make every change made through this transaction's keys visible at once"""
+        if not _CommitTransaction(self._handle):
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._committed = True
+
+
+class RegistryChangeWatch:
+    """Tells whether an open registry key's values were set since the last check"""
+
+    def __init__(self, key):
+        # Auto-reset event: a check that sees it signalled also clears it
+        self._event = _CreateEventW(None, False, False, None)
+        if not self._event:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._key = int(key)
+        try:
+            self._arm()
+        except OSError:
+            _CloseHandle(self._event)
+            raise
+
+    def _arm(self) -> None:
+        result = _RegNotifyChangeKeyValue(self._key, False, _REG_NOTIFY_CHANGE_LAST_SET, self._event, True)
+        if result != 0:
+            raise ctypes.WinError(result)
+
+    def changed(self) -> bool:
+        """True (and watching again) if the key's values were set since the watch was armed"""
+        if _WaitForSingleObject(self._event, 0) != _WAIT_OBJECT_0:
+            return False
+        # Re-armed before the caller re-reads, so a change during that read is not missed
+        self._arm()
+        return True
+
+    def close(self) -> None:
+        _CloseHandle(self._event)
+
+
 class PathManager:
     """Centralized path detection and management"""
 
@@ -226,6 +394,84 @@ class FileManager:
 
         return results
 
+    @staticmethod
+    def find_files_by_extensions(directory: str, extensions: tuple = ('.js', '.html')):
+        """Yield files with any of the given extensions from a single directory walk"""
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip hidden directories and node_modules
+                        if not entry.name.startswith('.') and entry.name != 'node_modules':
+                            yield from FileManager.find_files_by_extensions(entry.path, extensions)
+                    elif entry.name.endswith(extensions):
+                        yield entry.path
+                except OSError:
+                    continue
+
+    @staticmethod
+    def read_json(path: str):
+        """Load a JSON file, through orjson when it is installed"""
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def write_json(path: str, data, default=None, atomic: bool = False) -> None:
+        """Write a JSON file indented by two spaces in a single write, through orjson when it is installed"""
+        # Atomic writes go to a temporary file that then replaces the target, so
+        # readers see either no file or the complete one, never a partial write
+        target = path + ".tmp" if atomic else path
+        if orjson is not None:
+            with open(target, "wb") as f:
+                f.write(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2))
+        else:
+            # Serialize in one shot and write once; json.dump issues a write per fragment
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=2, default=default))
+        if atomic:
+            os.replace(target, path)
+
+    @staticmethod
+    def fast_copy(source_path: str, destination_path: str) -> str:
+        """Copy a file with its metadata, letting Windows do the copy natively when possible"""
+        if IS_WINDOWS and _CopyFileW(source_path, destination_path, False):
+            return destination_path
+
+        # Non-Windows, or CopyFileW failed - copy2 either succeeds or raises a proper exception
+        import shutil
+        return shutil.copy2(source_path, destination_path)
+
+    @staticmethod
+    def read_if_contains_any(file_path: str, needles) -> Optional[bytes]:
+        """Return a file's bytes if it contains any of the given byte strings, else None"""
+        with open(file_path, 'rb') as f:
+            # Empty files can't be mapped and can't contain anything
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            # Search through a read-only memory map; the bytes are only copied out on a hit
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if any(mm.find(needle) != -1 for needle in needles):
+                    return mm[:]
+                return None
+
+    @staticmethod
+    def covering_needles(keys) -> tuple:
+        """Encode search keys, dropping any key that contains a shorter one (its hits are found anyway)"""
+        needles = []
+        encoded = {key if isinstance(key, bytes) else key.encode("utf-8") for key in keys}
+        for key in sorted(encoded, key=len):
+            if not any(needle in key for needle in needles):
+                needles.append(key)
+        return tuple(needles)
+
     @staticmethod
     def safe_file_modify(file_path: str, replacements: dict, backup_dir: str, backup_suffix: str = "") -> bool:
         """Safely modify files with automatic backup and rollback on failure"""
@@ -358,6 +604,43 @@ class FileManager:
             return None
 
 
+class LiteralReplacer:
+    """Literal replacements applied key by key, in table order, like a str.replace loop"""
+
+    def __init__(self, replacements: dict):
+        self.table = replacements
+        # Keys replaced by themselves can't change anything; skipping them saves a scan each
+        self.items = tuple((key, value) for key, value in replacements.items() if key != value)
+
+        # A second pass can only change the output where a value holds a key, or meets the text
+        # around it to form one (an empty value joins its neighbours, which may form any key)
+        self.idempotent = not any(not value or self._overlaps(key, value)
+                                  for key, _ in self.items for _, value in self.items)
+
+    @staticmethod
+    def _overlaps(first, second) -> bool:
+        """True if one string contains the other or an end of one is the start of the other"""
+        if first in second or second in first:
+            return True
+        return any(first[-size:] == second[:size] or second[-size:] == first[:size]
+                   for size in range(1, min(len(first), len(second))))
+
+    def replace(self, content):
+        """Return content (str or bytes, matching the table) with every key replaced by its value"""
+        return self.subn(content)[0]
+
+    def subn(self, content) -> tuple:
+        """Like replace, also returning how many keys changed the content"""
+        changed = 0
+        for key, value in self.items:
+            # replace hands back the same object when the key isn't found, so no separate count scan
+            replaced = content.replace(key, value)
+            if replaced is not content:
+                changed += 1
+                content = replaced
+        return content, changed
+
+
 class BackupManager:
     """Unified backup management system"""
 
@@ -424,7 +707,6 @@ class BackupManager:
     def list_backups(self, backup_type: str = None, limit: int = None) -> list:
         """List available backups with filtering"""
         import json
-        from datetime import datetime
 
         backups = []
 
@@ -450,15 +732,7 @@ class BackupManager:
                         continue
 
                     # Add formatted date for display
-                    try:
-                        timestamp = backup_info.get('timestamp', '')
-                        if timestamp:
-                            date_obj = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                            backup_info['formatted_date'] = date_obj.strftime("%Y-%m-%d %H:%M")
-                        else:
-                            backup_info['formatted_date'] = "Unknown"
-                    except:
-                        backup_info['formatted_date'] = "Unknown"
+                    backup_info['formatted_date'] = format_backup_timestamp(backup_info.get('timestamp'))
 
                     backups.append(backup_info)
 
@@ -647,6 +921,25 @@ class BackupManager:
             return 0
 
 
+def format_backup_timestamp(timestamp) -> str:
+    """Format a "YYYYmmdd_HHMMSS" backup timestamp as "YYYY-mm-dd HH:MM", or "Unknown" if it is not one"""
+    # Fixed-width format, so slicing replaces a strptime/strftime round trip per table row.
+    # Only ASCII digits with every field in range take the fast path; days past 28 and
+    # anything else are left to strptime, which checks them against the calendar
+    if (isinstance(timestamp, str) and len(timestamp) == 15 and timestamp[8] == '_' and timestamp.isascii()
+            and timestamp[:8].isdigit() and timestamp[9:].isdigit()):
+        year, month, day = int(timestamp[0:4]), int(timestamp[4:6]), int(timestamp[6:8])
+        hour, minute, second = int(timestamp[9:11]), int(timestamp[11:13]), int(timestamp[13:15])
+        if year >= 1 and 1 <= month <= 12 and 1 <= day <= 28 and hour < 24 and minute < 60 and second < 60:
+            return f"{timestamp[0:4]}-{timestamp[4:6]}-{timestamp[6:8]} {timestamp[9:11]}:{timestamp[11:13]}"
+
+    from datetime import datetime
+    try:
+        return datetime.strptime(timestamp, "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return "Unknown"
+
+
 # Convenience functions for backward compatibility
 def is_admin() -> bool:
     """Convenience function for admin check"""